@@ -6,10 +6,6 @@ import os
 import sys
 from pathlib import Path
 
-# Add the src directory to the path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
-
 from lecture_notetaker import LectureNotetaker
 from lecture_notetaker.utils.config import Config
 
@@ -62,7 +58,7 @@ def quick_start():
         print("\n🎉 All connections successful!")
         print("\n📚 Ready to process lectures!")
         print("\nTo process a video, run:")
-        print('python main.py --url "https://www.youtube.com/watch?v=VIDEO_ID"')
+        print('python main.py process --url "https://www.youtube.com/watch?v=VIDEO_ID"')
         
         return True
         
@@ -1,64 +1,102 @@
 """Setup configuration for the Automated Lecture Notetaker."""
 
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
-# Read README file
 this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text(encoding="utf-8")
 
-# Read requirements
-requirements = []
-with open("requirements.txt") as f:
-    requirements = [line.strip() for line in f if line.strip() and not line.startswith("#")]
 
-setup(
-    name="automated-lecture-notetaker",
-    version="1.0.0",
-    description="An intelligent agent that processes YouTube lectures and creates structured notes in Notion",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    author="Your Name",
-    author_email="your.email@example.com",
-    url="https://github.com/your-username/llm-agent",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
-    python_requires=">=3.8",
-    install_requires=requirements,
-    extras_require={
-        "dev": [
-            "pytest>=7.4.0",
-            "pytest-cov>=4.1.0",
-            "black>=23.0.0",
-            "flake8>=6.0.0",
-            "mypy>=1.5.0",
-            "pre-commit>=3.4.0",
-        ]
-    },
-    entry_points={
-        "console_scripts": [
-            "lecture-notetaker=lecture_notetaker.cli.main:main",
+def read_long_description():
+    """Read the README used as the long description."""
+    return (this_directory / "README.md").read_text(encoding="utf-8")
+
+
+def read_requirements():
+    """Read install requirements from requirements.txt."""
+    with open(this_directory / "requirements.txt") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def build_ext_modules():
+    """Compile the CLI module with mypyc when LECTURE_NOTETAKER_USE_MYPYC=1.
+    
+    The compiled extension shadows cli/main.py, so the console script picks
+    it up unchanged. Requires mypy in the build environment.
+    """
+    if os.environ.get("LECTURE_NOTETAKER_USE_MYPYC") != "1":
+        return []
+    
+    from mypyc.build import mypycify
+    return mypycify(["src/lecture_notetaker/cli/main.py"])
+
+
+def main():
+    """Run setup(); file reads only happen when setup.py is executed."""
+    setup(
+        name="automated-lecture-notetaker",
+        version="1.0.0",
+        description="An intelligent agent that processes YouTube lectures and creates structured notes in Notion",
+        long_description=read_long_description(),
+        long_description_content_type="text/markdown",
+        author="Your Name",
+        author_email="your.email@example.com",
+        url="https://github.com/your-username/llm-agent",
+        packages=find_packages(where="src"),
+        package_dir={"": "src"},
+        python_requires=">=3.8",
+        install_requires=read_requirements(),
+        ext_modules=build_ext_modules(),
+        extras_require={
+            "dev": [
+                "pytest>=7.4.0",
+                "pytest-cov>=4.1.0",
+                "black>=23.0.0",
+                "flake8>=6.0.0",
+                "mypy>=1.5.0",
+                "pre-commit>=3.4.0",
+            ],
+            "fast": [
+                "orjson>=3.9.0",
+                "msgspec>=0.18.0",
+                "h2>=4.1.0",
+            ],
+            "cache": [
+                "diskcache>=5.6.0",
+            ],
+            "semantic-cache": [
+                "sentence-transformers>=2.2.0",
+                "faiss-cpu>=1.7.4",
+            ],
+        },
+        entry_points={
+            "console_scripts": [
+                "lecture-notetaker=lecture_notetaker.cli.main:main",
+            ],
+        },
+        classifiers=[
+            "Development Status :: 4 - Beta",
+            "Intended Audience :: Education",
+            "Intended Audience :: Developers",
+            "Topic :: Education",
+            "Topic :: Internet :: WWW/HTTP :: Dynamic Content",
+            "Topic :: Text Processing :: Markup",
+            "License :: OSI Approved :: MIT License",
+            "Programming Language :: Python :: 3",
+            "Programming Language :: Python :: 3.8",
+            "Programming Language :: Python :: 3.9",
+            "Programming Language :: Python :: 3.10",
+            "Programming Language :: Python :: 3.11",
+            "Programming Language :: Python :: 3.12",
         ],
-    },
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Education",
-        "Intended Audience :: Developers",
-        "Topic :: Education",
-        "Topic :: Internet :: WWW/HTTP :: Dynamic Content",
-        "Topic :: Text Processing :: Markup",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-    ],
-    keywords="youtube lecture notes ai automation notion education",
-    project_urls={
-        "Bug Reports": "https://github.com/your-username/llm-agent/issues",
-        "Source": "https://github.com/your-username/llm-agent",
-        "Documentation": "https://github.com/your-username/llm-agent#readme",
-    },
-)
+        keywords="youtube lecture notes ai automation notion education",
+        project_urls={
+            "Bug Reports": "https://github.com/your-username/llm-agent/issues",
+            "Source": "https://github.com/your-username/llm-agent",
+            "Documentation": "https://github.com/your-username/llm-agent#readme",
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,24 +4,33 @@ Automated Lecture Notetaker
 An intelligent agent that processes YouTube lectures and creates structured notes in Notion.
 """
 
+from .utils.compat import lazy_imports
+
 __version__ = "1.0.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .core.lecture_notetaker import LectureNotetaker
-from .utils.config import Config
-from .utils.exceptions import (
-    LectureNotetakerError,
-    TranscriptExtractionError,
-    AIProcessingError,
-    NotionAPIError
-)
+# Public names and the submodules that define them. They are imported on
+# first attribute access (PEP 562) so that importing the package, or a light
+# submodule like utils.config, does not load every service SDK.
+_LAZY_IMPORTS = {
+    "LectureNotetaker": ".core.lecture_notetaker",
+    "Config": ".utils.config",
+    "get_config": ".utils.config",
+    "LectureNotetakerError": ".utils.exceptions",
+    "TranscriptExtractionError": ".utils.exceptions",
+    "AIProcessingError": ".utils.exceptions",
+    "NotionAPIError": ".utils.exceptions",
+}
 
 __all__ = [
     "LectureNotetaker",
     "Config",
+    "get_config",
     "LectureNotetakerError",
     "TranscriptExtractionError", 
     "AIProcessingError",
     "NotionAPIError"
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS, __all__)
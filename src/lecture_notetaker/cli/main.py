@@ -1,43 +1,87 @@
 """Command-line interface for the Lecture Notetaker."""
 
-import argparse
+from __future__ import annotations
+
+import dataclasses
+import functools
+import itertools
+import json
 import sys
-from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
-from ..core.lecture_notetaker import LectureNotetaker
-from ..utils.config import Config
 from ..utils.logger import setup_logger, logger
-from ..utils.exceptions import LectureNotetakerError
+from ..utils.youtube_urls import PLAYLIST_ID_RE, VIDEO_ID_RE
 
+if TYPE_CHECKING:
+    import argparse
+    
+    from ..core.lecture_notetaker import LectureNotetaker
+    from ..utils.config import Config
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create command-line argument parser."""
-    parser = argparse.ArgumentParser(
-        description="Automated Lecture Notetaker - Convert YouTube lectures to structured Notion notes",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s --url "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-  %(prog)s --url "https://youtu.be/dQw4w9WgXcQ" --title "Custom Title"
-  %(prog)s --url "https://www.youtube.com/watch?v=dQw4w9WgXcQ" --chapters 8 --no-notion
-  %(prog)s --test-connections
-        """
+# Heavy imports (the core package pulls in the YouTube, Gemini and Notion
+# SDKs) are deferred to the handlers so --help and argument errors stay fast.
+# argparse itself is only imported when fast_parse() cannot handle the input.
+
+# URL shapes accepted per subcommand, checked before any service code is
+# imported so malformed input fails immediately. These are the patterns the
+# extractor uses, so only URLs it could not handle are rejected.
+URL_PATTERNS = {
+    "process": VIDEO_ID_RE,
+    "info": VIDEO_ID_RE,
+    "playlist": PLAYLIST_ID_RE,
+}
+
+# Output banners, built once at import rather than on every call
+OK_ICON = "✅"
+FAIL_ICON = "❌"
+CONNECTION_HEADER = "\n🔍 Connection Test Results:\n" + "=" * 30
+CONNECTIONS_OK_MESSAGE = "\n🎉 All connections successful! You're ready to go."
+CONNECTIONS_FAILED_MESSAGE = (
+    "\n⚠️  Some connections failed. Please check your API keys and configuration."
+)
+VIDEO_INFO_HEADER = "\n📺 Video Information:\n" + "=" * 50
+PROCESSING_HEADER = "\n🎓 Processing Complete!\n" + "=" * 50
+SUMMARY_HEADER = "\n📋 Summary:\n" + "-" * 20
+KEY_CONCEPTS_HEADER = "\n🔑 Key Concepts:\n" + "-" * 20
+
+
+def _add_common_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add options shared by every subcommand."""
+    parser.add_argument(
+        "--config",
+        type=str,
+        help="Path to a .env configuration file"
     )
     
-    # Main arguments
     parser.add_argument(
-        "--url",
-        type=str,
-        help="YouTube video URL to process"
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default="INFO",
+        help="Logging level (default: INFO)"
     )
     
     parser.add_argument(
-        "--playlist",
+        "--log-file",
         type=str,
-        help="YouTube playlist URL to process (processes all videos)"
+        help="Path to log file (default: console only)"
     )
     
+    parser.add_argument(
+        "--output",
+        choices=list(OUTPUT_FORMATS),
+        default="text",
+        help="Output format: human-readable text or JSON (default: text)"
+    )
+
+
+def _add_processing_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the note-generation options shared by ``process`` and ``playlist``."""
     parser.add_argument(
         "--title",
         type=str,
@@ -79,76 +123,335 @@ Examples:
         action="store_true",
         help="Skip creating Notion page (only process and display results)"
     )
-    
-    # Utility commands
-    parser.add_argument(
-        "--test-connections",
-        action="store_true",
-        help="Test all API connections and exit"
-    )
-    
+
+
+def _build_process_parser(parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the ``process`` subcommand."""
     parser.add_argument(
-        "--info",
+        "--url",
         type=str,
-        help="Get video information without processing"
+        required=True,
+        help="YouTube video URL to process"
     )
     
-    # Configuration
+    _add_processing_arguments(parser)
+
+
+def _build_playlist_parser(parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the ``playlist`` subcommand."""
     parser.add_argument(
-        "--config",
+        "--url",
         type=str,
-        help="Path to configuration file"
+        required=True,
+        help="YouTube playlist URL to process (processes all videos)"
     )
     
     parser.add_argument(
-        "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        default="INFO",
-        help="Logging level (default: INFO)"
+        "--max-concurrency",
+        type=int,
+        default=5,
+        help="Maximum number of videos processed at once (default: 5)"
     )
     
+    _add_processing_arguments(parser)
+
+
+def _build_info_parser(parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the ``info`` subcommand."""
     parser.add_argument(
-        "--log-file",
+        "--url",
         type=str,
-        help="Path to log file (default: console only)"
+        required=True,
+        help="YouTube video URL to inspect"
     )
+
+
+def _build_test_connections_parser(parser: argparse.ArgumentParser) -> None:
+    """The ``test-connections`` subcommand takes no extra arguments."""
+
+
+# Subcommand name -> (help text, builder). Builders only run for the selected
+# subcommand, so a normal invocation never constructs the other parsers.
+SUBCOMMANDS = {
+    "process": ("Process a single video", _build_process_parser),
+    "playlist": ("Process every video in a playlist", _build_playlist_parser),
+    "info": ("Get video information without processing", _build_info_parser),
+    "test-connections": ("Test all API connections and exit", _build_test_connections_parser),
+}
+
+# Pre-subcommand flags, mapped to the subcommand they now select and, for
+# flags that took a value, the option that value is forwarded to. Listed in
+# the precedence the flat layout applied when several were given.
+LEGACY_FLAGS = {
+    "--test-connections": ("test-connections", None),
+    "--info": ("info", "--url"),
+    "--url": ("process", "--url"),
+    "--playlist": ("playlist", "--url"),
+}
+
+# Flags of the flat layout that took no value
+LEGACY_SWITCHES = frozenset({"--test-connections", "--no-notion"})
+
+
+def _group_options(argv: List[str]) -> List[Tuple[str, List[str]]]:
+    """Split arguments into ``(flag name, tokens)`` groups.
+    
+    A flag given as ``--flag value`` takes the next token along, unless that
+    token is another flag. Stray positional tokens form groups named "".
+    """
+    groups = []
+    tokens = iter(argv)
+    for token in tokens:
+        if not token.startswith("--"):
+            groups.append(("", [token]))
+            continue
+        
+        name, sep, _ = token.partition("=")
+        group = [token]
+        if not sep and name not in LEGACY_SWITCHES:
+            value = next(tokens, None)
+            if value is not None:
+                if value.startswith("--"):
+                    tokens = itertools.chain([value], tokens)
+                else:
+                    group.append(value)
+        groups.append((name, group))
+    return groups
+
+
+def translate_legacy_args(argv: List[str]) -> List[str]:
+    """Rewrite the old flat flag layout into the subcommand layout.
+    
+    ``--url X`` becomes ``process --url X``, ``--playlist X`` becomes
+    ``playlist --url X``, ``--info X`` becomes ``info --url X`` and
+    ``--test-connections`` becomes ``test-connections``.
+    
+    Like the flat layout, the flag with the highest precedence wins and
+    the other selecting flags (with their values) are ignored, so
+    ``--info A --url B`` inspects A. ``--test-connections`` also ignores
+    every option other than the common ones.
+    
+    Args:
+        argv: Command-line arguments (without the program name)
+        
+    Returns:
+        Arguments in the subcommand layout
+    """
+    if not argv or argv[0] in SUBCOMMANDS:
+        return argv
+    
+    groups = _group_options(argv)
+    names = {name for name, _ in groups}
+    for flag, (command, target) in LEGACY_FLAGS.items():
+        if flag not in names:
+            continue
+        
+        rest = []
+        for name, tokens in groups:
+            if name == flag:
+                if target is not None:
+                    rest.append(target + tokens[0][len(flag):])
+                    rest.extend(tokens[1:])
+            elif name in LEGACY_FLAGS:
+                continue
+            elif command == "test-connections" and name not in COMMON_FLAGS:
+                continue
+            else:
+                rest.extend(tokens)
+        return [command] + rest
+    
+    return argv
+
+
+EXAMPLES_EPILOG = """
+Examples:
+  %(prog)s process --url "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+  %(prog)s process --url "https://youtu.be/dQw4w9WgXcQ" --title "Custom Title"
+  %(prog)s process --url "https://www.youtube.com/watch?v=dQw4w9WgXcQ" --chapters 8 --no-notion
+  %(prog)s test-connections
+        """
+
+
+@functools.lru_cache(maxsize=None)
+def create_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Create command-line argument parser.
+    
+    Parsers are cached per ``command``, so repeated calls (e.g. several
+    ``main()`` invocations in one process) reuse the same instance.
+    
+    Args:
+        command: Subcommand that will be parsed. If given, only that
+            subcommand's parser is built; otherwise all are (for help output).
+            
+    Returns:
+        Configured argument parser
+    """
+    import argparse
+    
+    # The examples are only shown in top-level help, which is never printed
+    # once a subcommand has been selected.
+    parser = argparse.ArgumentParser(
+        description="Automated Lecture Notetaker - Convert YouTube lectures to structured Notion notes",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EXAMPLES_EPILOG if command not in SUBCOMMANDS else None
+    )
+    
+    subparsers = parser.add_subparsers(dest="cmd", metavar="COMMAND")
+    
+    names = [command] if command in SUBCOMMANDS else list(SUBCOMMANDS)
+    for name in names:
+        help_text, build = SUBCOMMANDS[name]
+        subparser = subparsers.add_parser(name, help=help_text, description=help_text)
+        build(subparser)
+        _add_common_arguments(subparser)
     
     return parser
 
 
-def main() -> int:
+# Flags understood by fast_parse(): flag -> (dest, type, default). A type of
+# None marks a store_true flag. Defaults must match the argparse builders.
+FlagSpec = Tuple[str, Optional[Callable[[str], Any]], Any]
+
+COMMON_FLAGS: Dict[str, FlagSpec] = {
+    "--config": ("config", str, None),
+    "--log-level": ("log_level", str, "INFO"),
+    "--log-file": ("log_file", str, None),
+    "--output": ("output", str, "text"),
+}
+
+PROCESSING_FLAGS: Dict[str, FlagSpec] = {
+    "--title": ("title", str, None),
+    "--language": ("language", str, "en"),
+    "--summary-length": ("summary_length", int, 300),
+    "--chapters": ("chapters", int, 5),
+    "--key-concepts": ("key_concepts", int, 10),
+    "--no-notion": ("no_notion", None, False),
+}
+
+FAST_FLAGS: Dict[str, Dict[str, FlagSpec]] = {
+    "process": {
+        "--url": ("url", str, None),
+        **PROCESSING_FLAGS,
+    },
+    "playlist": {
+        "--url": ("url", str, None),
+        "--max-concurrency": ("max_concurrency", int, 5),
+        **PROCESSING_FLAGS,
+    },
+    "info": {
+        "--url": ("url", str, None),
+    },
+    "test-connections": {},
+}
+
+REQUIRED_FLAGS: Dict[str, Tuple[str, ...]] = {
+    "process": ("url",),
+    "playlist": ("url",),
+    "info": ("url",),
+    "test-connections": (),
+}
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+OUTPUT_FORMATS = ("text", "json")
+
+
+def fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse well-formed arguments without building an argparse parser.
+    
+    Only handles exact long flags (``--flag value`` or ``--flag=value``) for a
+    known subcommand. Anything else, including ``-h``/``--help``, unknown or
+    abbreviated flags and invalid values, returns None so the caller can fall
+    back to argparse for full handling and error messages.
+    
+    Args:
+        argv: Arguments in the subcommand layout
+        
+    Returns:
+        Parsed arguments, or None if argparse should handle the input
+    """
+    if not argv or argv[0] not in FAST_FLAGS:
+        return None
+    
+    command = argv[0]
+    flags = FAST_FLAGS[command]
+    values: Dict[str, Any] = {dest: default for dest, _, default in COMMON_FLAGS.values()}
+    values.update((dest, default) for dest, _, default in flags.values())
+    
+    tokens = iter(argv[1:])
+    for token in tokens:
+        name, sep, value = token.partition("=")
+        spec = flags.get(name) or COMMON_FLAGS.get(name)
+        if spec is None:
+            return None
+        
+        dest, convert, _ = spec
+        if convert is None:
+            if sep:
+                return None
+            values[dest] = True
+            continue
+        
+        if not sep:
+            next_token = next(tokens, None)
+            if next_token is None or next_token.startswith("-"):
+                return None
+            value = next_token
+        try:
+            values[dest] = convert(value)
+        except ValueError:
+            return None
+    
+    if values["log_level"] not in LOG_LEVELS or values["output"] not in OUTPUT_FORMATS:
+        return None
+    if any(values[dest] is None for dest in REQUIRED_FLAGS[command]):
+        return None
+    
+    return SimpleNamespace(cmd=command, **values)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main CLI entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
+    argv = translate_legacy_args(sys.argv[1:] if argv is None else list(argv))
+    args: Any = fast_parse(argv)
+    
+    if args is None:
+        parser = create_parser(argv[0] if argv else None)
+        args = parser.parse_args(argv)
+        
+        if args.cmd is None:
+            parser.print_help()
+            return 1
+    
+    pattern = URL_PATTERNS.get(args.cmd)
+    if pattern is not None and not pattern.search(args.url):
+        create_parser(args.cmd).error(f"invalid YouTube URL: {args.url}")
     
-    # Setup logging
-    setup_logger(level=args.log_level, log_file=args.log_file)
+    # Setup logging. Only done once we know there is work to run, and only
+    # if the options differ from the default logger configured on import.
+    # JSON output keeps stdout clean by logging to stderr.
+    if args.log_level != "INFO" or args.log_file or args.output == "json":
+        setup_logger(
+            level=args.log_level,
+            log_file=args.log_file,
+            stream=sys.stderr if args.output == "json" else sys.stdout
+        )
+    
+    from ..utils.config import Config
+    from ..utils.exceptions import LectureNotetakerError
     
     try:
-        # Load configuration
         if args.config:
             logger.info(f"Loading configuration from {args.config}")
-            # In a full implementation, you would load from file
-            config = Config.from_env()
-        else:
-            config = Config.from_env()
+        config = Config.from_env(args.config)
         
-        # Test connections if requested
-        if args.test_connections:
-            return test_connections(config)
-        
-        # Get video info if requested
-        if args.info:
-            return get_video_info(config, args.info)
-        
-        # Process video or playlist
-        if args.url:
+        if args.cmd == "test-connections":
+            return test_connections(config, args.output)
+        elif args.cmd == "info":
+            return get_video_info(config, args.url, args.output)
+        elif args.cmd == "process":
             return process_video(config, args)
-        elif args.playlist:
-            return process_playlist(config, args)
         else:
-            parser.print_help()
-            return 1
+            return process_playlist(config, args)
             
     except KeyboardInterrupt:
         logger.info("Operation cancelled by user")
@@ -161,53 +464,115 @@ def main() -> int:
         return 1
 
 
-def test_connections(config: Config) -> int:
+def get_notetaker(config: Config) -> LectureNotetaker:
+    """Return a shared LectureNotetaker for the given configuration.
+    
+    Handlers that run in the same process reuse one instance (and its service
+    clients) instead of each constructing their own.
+    
+    Args:
+        config: Configuration object
+        
+    Returns:
+        LectureNotetaker instance
+    """
+    return _cached_notetaker(config)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_notetaker(config: Config) -> LectureNotetaker:
+    from ..core.lecture_notetaker import LectureNotetaker
+    
+    return LectureNotetaker(config)
+
+
+def format_duration(seconds: int) -> str:
+    """Format a duration in seconds as ``M:SS``."""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def write_lines(lines: List[str]) -> None:
+    """Write a block of output lines to stdout in a single write and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def write_json(data: Any) -> None:
+    """Write one JSON document as a single line to stdout."""
+    if orjson:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        sys.stdout.write(json.dumps(data, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+
+def test_connections(config: Config, output: str = "text") -> int:
     """Test all API connections."""
     logger.info("Testing API connections...")
     
     try:
-        notetaker = LectureNotetaker(config)
+        notetaker = get_notetaker(config)
         results = notetaker.test_connections()
         
-        print("\n🔍 Connection Test Results:")
-        print("=" * 30)
+        if output == "json":
+            write_json(results)
+            return 0 if all(results.values()) else 1
+        
+        lines = [CONNECTION_HEADER]
         
         all_good = True
         for service, status in results.items():
-            status_icon = "✅" if status else "❌"
+            status_icon = OK_ICON if status else FAIL_ICON
             service_name = service.replace('_', ' ').title()
-            print(f"{status_icon} {service_name}: {'Connected' if status else 'Failed'}")
+            lines.append(f"{status_icon} {service_name}: {'Connected' if status else 'Failed'}")
             if not status:
                 all_good = False
         
-        if all_good:
-            print("\n🎉 All connections successful! You're ready to go.")
-            return 0
-        else:
-            print("\n⚠️  Some connections failed. Please check your API keys and configuration.")
-            return 1
+        lines.append(CONNECTIONS_OK_MESSAGE if all_good else CONNECTIONS_FAILED_MESSAGE)
+        write_lines(lines)
+        
+        return 0 if all_good else 1
             
     except Exception as e:
         logger.error(f"Connection test failed: {e}")
         return 1
 
 
-def get_video_info(config: Config, url: str) -> int:
+def get_video_info(config: Config, url: str, output: str = "text") -> int:
     """Get and display video information."""
+    # Only the YouTube side is needed here, so skip the Gemini and Notion
+    # clients (and their SDK imports) that LectureNotetaker would set up.
+    from ..core.transcript_extractor import TranscriptExtractor
+    from ..utils.exceptions import ConfigurationError
+    
     try:
-        notetaker = LectureNotetaker(config)
-        video_info = notetaker.get_video_info(url)
-        
-        print("\n📺 Video Information:")
-        print("=" * 50)
-        print(f"Title: {video_info.title}")
-        print(f"Channel: {video_info.channel_title}")
-        print(f"Duration: {video_info.duration // 60}:{video_info.duration % 60:02d}")
-        print(f"Published: {video_info.published_at.split('T')[0]}")
-        print(f"Views: {video_info.view_count:,}")
+        if not config.youtube_api_key:
+            raise ConfigurationError("Missing required environment variable: YOUTUBE_API_KEY")
+        
+        extractor = TranscriptExtractor(
+            config.youtube_api_key, cache_dir=config.cache_dir or None
+        )
+        video_info = extractor.get_video_info(extractor.extract_video_id(url))
+        
+        if output == "json":
+            write_json(dataclasses.asdict(video_info))
+            return 0
+        
+        lines = [
+            VIDEO_INFO_HEADER,
+            f"Title: {video_info.title}",
+            f"Channel: {video_info.channel_title}",
+            f"Duration: {format_duration(video_info.duration)}",
+            f"Published: {video_info.published_at[:10]}",
+            f"Views: {video_info.view_count:,}",
+        ]
         if video_info.like_count:
-            print(f"Likes: {video_info.like_count:,}")
-        print(f"URL: https://www.youtube.com/watch?v={video_info.id}")
+            lines.append(f"Likes: {video_info.like_count:,}")
+        lines.append(f"URL: https://www.youtube.com/watch?v={video_info.id}")
+        write_lines(lines)
         
         return 0
         
@@ -221,7 +586,7 @@ def process_video(config: Config, args: argparse.Namespace) -> int:
     try:
         logger.info(f"Processing video: {args.url}")
         
-        notetaker = LectureNotetaker(config)
+        notetaker = get_notetaker(config)
         result = notetaker.process_video(
             url=args.url,
             title=args.title,
@@ -232,34 +597,39 @@ def process_video(config: Config, args: argparse.Namespace) -> int:
             create_notion_page=not args.no_notion
         )
         
+        if args.output == "json":
+            write_json(dataclasses.asdict(result))
+            return 0 if result.success else 1
+        
         if not result.success:
             logger.error(f"Processing failed: {result.error_message}")
             return 1
         
         # Display results
-        print("\n🎓 Processing Complete!")
-        print("=" * 50)
-        print(f"📺 Video: {result.video_info.title}")
-        print(f"📝 Summary: {len(result.processed_content.summary.split())} words")
-        print(f"🔑 Key Concepts: {len(result.processed_content.key_concepts)}")
-        print(f"📖 Chapters: {len(result.processed_content.chapters)}")
-        print(f"❓ Review Questions: {len(result.processed_content.questions)}")
+        content = result.processed_content
+        lines = [
+            PROCESSING_HEADER,
+            f"📺 Video: {result.video_info.title}",
+            f"📝 Summary: {content.word_count} words",
+            f"🔑 Key Concepts: {len(content.key_concepts)}",
+            f"📖 Chapters: {len(content.chapters)}",
+            f"❓ Review Questions: {len(content.questions)}",
+        ]
         
         if result.notion_url:
-            print(f"🔗 Notion Page: {result.notion_url}")
+            lines.append(f"🔗 Notion Page: {result.notion_url}")
         
         # Display summary if not creating Notion page
         if args.no_notion:
-            print(f"\n📋 Summary:")
-            print("-" * 20)
-            print(result.processed_content.summary)
+            lines.append(SUMMARY_HEADER)
+            lines.append(content.summary)
             
-            if result.processed_content.key_concepts:
-                print(f"\n🔑 Key Concepts:")
-                print("-" * 20)
-                for i, concept in enumerate(result.processed_content.key_concepts[:5], 1):
-                    print(f"{i}. **{concept.term}**: {concept.definition}")
+            if content.key_concepts:
+                lines.append(KEY_CONCEPTS_HEADER)
+                for i, concept in enumerate(content.key_concepts[:5], 1):
+                    lines.append(f"{i}. **{concept.term}**: {concept.definition}")
         
+        write_lines(lines)
         return 0
         
     except Exception as e:
@@ -269,20 +639,27 @@ def process_video(config: Config, args: argparse.Namespace) -> int:
 
 def process_playlist(config: Config, args: argparse.Namespace) -> int:
     """Process a playlist."""
-    logger.info(f"Processing playlist: {args.playlist}")
+    import asyncio
+    
+    logger.info(f"Processing playlist: {args.url}")
     
     try:
-        notetaker = LectureNotetaker(config)
-        results = notetaker.process_playlist(args.playlist)
-        
-        print(f"\n🎵 Processed {len(results)} videos from playlist")
+        notetaker = get_notetaker(config)
+        results = asyncio.run(_report_playlist(notetaker, args))
         
         successful = sum(1 for r in results if r.success)
         failed = len(results) - successful
         
-        print(f"✅ Successful: {successful}")
+        if args.output == "json":
+            return 0 if failed == 0 else 1
+        
+        lines = [
+            f"\n🎵 Processed {len(results)} videos from playlist",
+            f"{OK_ICON} Successful: {successful}",
+        ]
         if failed > 0:
-            print(f"❌ Failed: {failed}")
+            lines.append(f"{FAIL_ICON} Failed: {failed}")
+        write_lines(lines)
         
         return 0 if failed == 0 else 1
         
@@ -291,5 +668,32 @@ def process_playlist(config: Config, args: argparse.Namespace) -> int:
         return 1
 
 
+async def _report_playlist(notetaker: LectureNotetaker, args: argparse.Namespace) -> list:
+    """Process a playlist, printing each video's outcome as soon as it finishes."""
+    results = []
+    try:
+        async for result in notetaker.process_playlist_async(
+            args.url,
+            max_concurrency=args.max_concurrency,
+            title=args.title,
+            language=args.language,
+            summary_length=args.summary_length,
+            chapters=args.chapters,
+            key_concepts_limit=args.key_concepts,
+            create_notion_page=not args.no_notion
+        ):
+            results.append(result)
+            if args.output == "json":
+                # One JSON line per video (JSONL), emitted as each one finishes
+                write_json(dataclasses.asdict(result))
+            elif result.success:
+                write_lines([f"{OK_ICON} {result.video_info.title}"])
+            else:
+                write_lines([f"{FAIL_ICON} {result.error_message}"])
+    finally:
+        await notetaker.aclose()
+    return results
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,9 +1,19 @@
 """Core package for the Lecture Notetaker."""
 
-from .transcript_extractor import TranscriptExtractor, VideoInfo, TranscriptSegment
-from .ai_processor import AIProcessor, ProcessedContent, KeyConcept, Chapter
-from .notion_client import NotionClient
-from .lecture_notetaker import LectureNotetaker
+from ..utils.compat import lazy_imports
+
+# Loaded on first attribute access (PEP 562); see the top-level package.
+_LAZY_IMPORTS = {
+    "TranscriptExtractor": ".transcript_extractor",
+    "VideoInfo": ".transcript_extractor",
+    "TranscriptSegment": ".transcript_extractor",
+    "AIProcessor": ".ai_processor",
+    "ProcessedContent": ".ai_processor",
+    "KeyConcept": ".ai_processor",
+    "Chapter": ".ai_processor",
+    "NotionClient": ".notion_client",
+    "LectureNotetaker": ".lecture_notetaker",
+}
 
 __all__ = [
     "TranscriptExtractor",
@@ -16,3 +26,5 @@ __all__ = [
     "NotionClient",
     "LectureNotetaker"
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS, __all__)
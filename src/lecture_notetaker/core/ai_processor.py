@@ -1,8 +1,15 @@
 """AI processing module using Google's Gemini API."""
 
+import asyncio
+import bisect
+import functools
+import hashlib
+import io
+import json
+import operator
 import re
-import time
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Callable, Dict, List, Optional, Any, Set, Tuple, Union
 from dataclasses import dataclass
 
 try:
@@ -10,12 +17,189 @@ try:
 except ImportError:
     genai = None
 
+try:
+    from google.api_core.exceptions import InvalidArgument
+except ImportError:
+    InvalidArgument = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 from .transcript_extractor import TranscriptSegment, VideoInfo
+from ..utils.async_utils import run_sync
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.exceptions import AIProcessingError
+from ..utils.llm_cache import LLMCache, SemanticLLMCache
 from ..utils.logger import logger
+from ..utils.rate_limit import TokenBucket
+
+# genai.configure() discards the SDK's cached API clients, and with them the
+# gRPC channel (one HTTP/2 connection multiplexing every call). It is
+# therefore only called when the API key changes, so all AIProcessor
+# instances and all calls share one connection.
+_configure_lock = threading.Lock()
+_configured_api_key: Optional[str] = None
+
+
+def _configure_genai(api_key: str) -> None:
+    """Configure the Gemini SDK for ``api_key`` unless already done."""
+    global _configured_api_key
+    with _configure_lock:
+        if api_key != _configured_api_key:
+            genai.configure(api_key=api_key)
+            _configured_api_key = api_key
+
+
+# Gemini 1.0 models reject JSON mode (response_mime_type). Other models that
+# turn out to reject it are remembered by name for the rest of the process,
+# so each video does not spend a failed call before the per-section prompts.
+_NO_JSON_MODE_PREFIXES = ("gemini-pro", "gemini-1.0")
+_json_mode_rejected: Set[str] = set()
+
+
+def _supports_json_mode(model_name: str) -> bool:
+    """Return whether the combined JSON-mode overview call is worth trying."""
+    name = model_name.split("/")[-1]
+    return not name.startswith(_NO_JSON_MODE_PREFIXES) and name not in _json_mode_rejected
+
+
+# Upper bound on concurrent per-chapter model calls, to stay within the
+# API's request-rate quota.
+MAX_CONCURRENT_CHAPTER_CALLS = 4
+
+# Transcript characters sent in whole-lecture and per-chapter prompts
+TRANSCRIPT_PROMPT_CHARS = 8000
+SHORT_TRANSCRIPT_PROMPT_CHARS = 6000
+CHAPTER_PROMPT_CHARS = 2000
+
+# Tagged lines in model responses. Horizontal whitespace only, so an empty
+# value never swallows the following line.
+_CONCEPT_RE = re.compile(r'^(CONCEPT|DEFINITION|IMPORTANCE):[ \t]*(.*)$', re.MULTILINE)
+_CHAPTER_FIELD_RE = re.compile(r'^[ \t]*(TITLE|SUMMARY):[ \t]*(.*)$', re.MULTILINE)
+_KEY_POINTS_RE = re.compile(r'^[ \t]*KEY_POINTS:', re.MULTILINE)
+_BULLET_RE = re.compile(r'^[ \t]*- (.*)$', re.MULTILINE)
+
+# Response tag -> KeyConcept field
+_CONCEPT_FIELDS = {
+    'CONCEPT': 'term',
+    'DEFINITION': 'definition',
+    'IMPORTANCE': 'importance',
+}
+
+# Markdown code fence some models wrap JSON output in
+_JSON_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*|\s*```\s*$')
+
+# Fastest available JSON decoder
+_json_loads = orjson.loads if orjson else json.loads
+
+if msgspec:
+    class _KeyConceptSchema(msgspec.Struct):
+        """Key concept as returned in the overview response."""
+        term: str
+        definition: str
+        importance: str
+
+    class _OverviewSchema(msgspec.Struct):
+        """Expected shape of the combined overview response."""
+        summary: str
+        key_concepts: List[_KeyConceptSchema]
+        main_topics: List[str]
+        learning_objectives: List[str]
+        questions: List[str]
 
+# Generation settings for the combined overview call
+JSON_GENERATION_CONFIG = {"response_mime_type": "application/json"}
 
-@dataclass
+# Static task instructions. Every prompt starts with one of these and only
+# then appends the per-video details and transcript, so prompts for the same
+# task share a byte-identical prefix that the API can serve from its cache.
+SUMMARY_INSTRUCTIONS = """Please create a comprehensive summary of this lecture transcript.
+
+Focus on:
+- Main topics and themes
+- Key learning points
+- Important concepts and definitions
+- Practical applications or examples
+"""
+
+KEY_CONCEPTS_INSTRUCTIONS = """Analyze this lecture transcript and extract the most important key concepts.
+
+For each concept, provide:
+1. Term/Concept name
+2. Clear definition or explanation
+3. Why it's important in the context of this lecture
+
+Format your response as:
+CONCEPT: [Term]
+DEFINITION: [Clear definition]
+IMPORTANCE: [Why it matters]
+---
+"""
+
+CHAPTER_INSTRUCTIONS = """Create a chapter summary for this section of the lecture.
+
+Provide:
+1. A descriptive chapter title
+2. A brief summary (2-3 sentences)
+3. 3-5 key points covered in this section
+
+Format:
+TITLE: [Chapter Title]
+SUMMARY: [Brief summary]
+KEY_POINTS:
+- [Point 1]
+- [Point 2]
+- [Point 3]
+"""
+
+MAIN_TOPICS_INSTRUCTIONS = """Identify the main topics covered in this lecture.
+
+List the 5-8 most important topics in order of importance.
+Be concise - each topic should be 2-5 words.
+"""
+
+LEARNING_OBJECTIVES_INSTRUCTIONS = """Based on this lecture content, create clear learning objectives.
+
+Generate 4-6 learning objectives that students should achieve after watching this lecture.
+Start each objective with an action verb (understand, explain, analyze, apply, etc.).
+
+Format: "Students will be able to..."
+"""
+
+OVERVIEW_INSTRUCTIONS = """Analyze this lecture transcript and produce structured study material.
+
+Respond with a single JSON object with exactly these fields:
+- "summary": a comprehensive summary of the lecture (string), focusing on the
+  main topics and themes, key learning points, important concepts and
+  definitions, and practical applications or examples
+- "key_concepts": the most important key concepts (array of objects with
+  string fields "term", "definition", and "importance", the last explaining
+  why the concept matters in the context of this lecture)
+- "main_topics": the 5-8 most important topics in order of importance, each
+  2-5 words (array of strings)
+- "learning_objectives": 4-6 learning objectives, each starting with
+  "Students will be able to" followed by an action verb (array of strings)
+- "questions": 5-8 review questions mixing factual, conceptual, and
+  application questions (array of strings)
+
+Do not include any text outside the JSON object.
+"""
+
+QUESTIONS_INSTRUCTIONS = """Create thoughtful review questions for this lecture.
+
+Generate 5-8 questions that test understanding of the key concepts.
+Mix different types: factual, conceptual, and application questions.
+"""
+
+
+@dataclass(**DATACLASS_SLOTS)
 class KeyConcept:
     """A key concept extracted from the lecture."""
     term: str
@@ -24,7 +208,7 @@ class KeyConcept:
     timestamp: Optional[float] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Chapter:
     """A chapter/section of the lecture."""
     title: str
@@ -34,7 +218,7 @@ class Chapter:
     key_points: List[str]
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProcessedContent:
     """Result of AI processing."""
     summary: str
@@ -43,17 +227,30 @@ class ProcessedContent:
     main_topics: List[str]
     learning_objectives: List[str]
     questions: List[str]
+    
+    @property
+    def word_count(self) -> int:
+        """Number of words in the summary."""
+        return len(self.summary.split())
 
 
 class AIProcessor:
     """Processes lecture transcripts using Google's Gemini API."""
     
-    def __init__(self, api_key: str, model_name: str = "gemini-pro"):
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = "gemini-pro",
+        cache: Optional[Union[LLMCache, SemanticLLMCache]] = None,
+        rate_limiter: Optional[TokenBucket] = None
+    ):
         """Initialize the AI processor.
         
         Args:
             api_key: Google AI API key
             model_name: Name of the Gemini model to use
+            cache: Optional persistent cache for model responses
+            rate_limiter: Optional limiter applied to every model call
         """
         if not genai:
             raise AIProcessingError(
@@ -63,12 +260,14 @@ class AIProcessor:
         self.api_key = api_key
         self.model_name = model_name
         self.model = None
+        self._cache = cache
+        self._rate_limiter = rate_limiter
         self._init_model()
     
     def _init_model(self) -> None:
         """Initialize the Gemini model."""
         try:
-            genai.configure(api_key=self.api_key)
+            _configure_genai(self.api_key)
             self.model = genai.GenerativeModel(self.model_name)
             logger.info(f"Initialized {self.model_name} model")
         except Exception as e:
@@ -95,45 +294,59 @@ class AIProcessor:
         Returns:
             ProcessedContent with structured information
         """
-        # Combine transcript text
-        full_transcript = self._combine_transcript(transcript_segments)
+        return run_sync(self.process_transcript_async(
+            video_info=video_info,
+            transcript_segments=transcript_segments,
+            summary_length=summary_length,
+            num_chapters=num_chapters,
+            key_concepts_limit=key_concepts_limit
+        ))
+    
+    async def process_transcript_async(
+        self,
+        video_info: VideoInfo,
+        transcript_segments: List[TranscriptSegment],
+        summary_length: int = 300,
+        num_chapters: int = 5,
+        key_concepts_limit: int = 10
+    ) -> ProcessedContent:
+        """Async variant of process_transcript.
+        
+        The six extraction steps are independent, so their model calls are
+        issued concurrently and total latency is that of the slowest one.
+        
+        Args:
+            video_info: Video metadata
+            transcript_segments: List of transcript segments
+            summary_length: Target length for summary (words)
+            num_chapters: Number of chapters to create
+            key_concepts_limit: Maximum number of key concepts to extract
+            
+        Returns:
+            ProcessedContent with structured information
+        """
+        # Only the start of the transcript (and of each chapter) is sent to the
+        # model, so only that much text is ever assembled
+        full_transcript = self._combine_transcript_capped(
+            transcript_segments, TRANSCRIPT_PROMPT_CHARS
+        )
+        content_hash = self._hash_transcript(transcript_segments)
+        chapter_texts = self._split_into_chapters(
+            transcript_segments, video_info.duration, num_chapters
+        )
         
         logger.info("Starting AI processing of transcript...")
         
-        # Process different aspects in parallel if possible, or sequentially
         try:
-            # Generate summary
-            summary = self._generate_summary(video_info, full_transcript, summary_length)
-            
-            # Extract key concepts
-            key_concepts = self._extract_key_concepts(
-                video_info, full_transcript, key_concepts_limit
-            )
-            
-            # Generate chapters
-            chapters = self._generate_chapters(
-                video_info, transcript_segments, num_chapters
+            overview, chapters = await asyncio.gather(
+                self._generate_overview(
+                    video_info, full_transcript, summary_length, key_concepts_limit,
+                    content_hash
+                ),
+                self._generate_chapters(video_info, chapter_texts, content_hash)
             )
             
-            # Extract main topics
-            main_topics = self._extract_main_topics(video_info, full_transcript)
-            
-            # Generate learning objectives
-            learning_objectives = self._generate_learning_objectives(
-                video_info, full_transcript
-            )
-            
-            # Generate review questions
-            questions = self._generate_questions(video_info, full_transcript)
-            
-            return ProcessedContent(
-                summary=summary,
-                key_concepts=key_concepts,
-                chapters=chapters,
-                main_topics=main_topics,
-                learning_objectives=learning_objectives,
-                questions=questions
-            )
+            return ProcessedContent(chapters=chapters, **overview)
             
         except Exception as e:
             logger.error(f"AI processing failed: {e}")
@@ -143,67 +356,368 @@ class AIProcessor:
         """Combine transcript segments into a single text."""
         return '\n'.join(segment.text for segment in segments)
     
-    def _generate_summary(self, video_info: VideoInfo, transcript: str, target_length: int) -> str:
-        """Generate a concise summary of the lecture."""
-        prompt = f"""
-        Please create a comprehensive summary of this lecture transcript.
+    def _combine_transcript_capped(
+        self, segments: List[TranscriptSegment], max_chars: int
+    ) -> str:
+        """Combine transcript segments, stopping once ``max_chars`` is reached.
         
-        Video Title: {video_info.title}
-        Channel: {video_info.channel_title}
-        Duration: {video_info.duration // 60} minutes
+        Equivalent to ``_combine_transcript(segments)[:max_chars]`` without
+        building the full text of long lectures.
+        """
+        buffer = io.StringIO()
+        for i, segment in enumerate(segments):
+            if i:
+                buffer.write('\n')
+            buffer.write(segment.text)
+            if buffer.tell() >= max_chars:
+                break
+        return buffer.getvalue()[:max_chars]
+    
+    def _hash_transcript(self, segments: List[TranscriptSegment]) -> str:
+        """Return the SHA-256 of the full transcript text, for cache keys.
+        
+        Prompts only contain the start of the transcript, so the prompt alone
+        cannot tell apart two lectures that begin the same way.
+        """
+        digest = hashlib.sha256()
+        for segment in segments:
+            digest.update(segment.text.encode('utf-8'))
+            digest.update(b'\n')
+        return digest.hexdigest()
+    
+    def _split_into_chapters(
+        self, segments: List[TranscriptSegment], total_duration: float, num_chapters: int
+    ) -> List[str]:
+        """Split the transcript into equal-length time windows.
+        
+        Window boundaries are found by binary search over the segment start
+        times, and each window then reads only as many segments as fit in
+        ``CHAPTER_PROMPT_CHARS``, so most segments of a long lecture are
+        never visited. Segments starting at or after the end of the video
+        are dropped.
+        
+        Returns:
+            The (capped) text of each window, one string per chapter
+        """
+        if num_chapters <= 0 or total_duration <= 0:
+            return []
+        
+        # Transcripts normally arrive in order, where this sort is a linear scan
+        segments = sorted(segments, key=operator.attrgetter('start'))
+        starts = [segment.start for segment in segments]
+        chapter_duration = total_duration / num_chapters
+        chapter_texts = []
+        
+        for i in range(num_chapters):
+            start_time = i * chapter_duration
+            end_time = total_duration if i == num_chapters - 1 else (i + 1) * chapter_duration
+            
+            texts = []
+            size = 0
+            position = bisect.bisect_left(starts, max(start_time, 0))
+            while (
+                position < len(segments)
+                and starts[position] < end_time
+                and size < CHAPTER_PROMPT_CHARS
+            ):
+                text = segments[position].text
+                texts.append(text)
+                size += len(text) + 1
+                position += 1
+            
+            chapter_texts.append('\n'.join(texts)[:CHAPTER_PROMPT_CHARS])
+        
+        return chapter_texts
+    
+    def _generate(
+        self,
+        prompt: str,
+        source: str,
+        task: str,
+        params: Dict[str, Any],
+        content_hash: str,
+        generation_config: Optional[Dict[str, Any]] = None,
+        parse: Optional[Callable[[str], Any]] = None
+    ) -> Any:
+        """Return the model's response text for a prompt, using the cache.
+        
+        This is the single point through which all model calls go. Cache
+        hits do not count against the rate limit.
+        
+        With ``parse``, its result is returned instead of the text, and a
+        response is only cached once it parses, so a malformed response is
+        not replayed on later runs. A cached response that no longer parses
+        is replaced by a fresh one.
+        
+        Args:
+            prompt: Prompt to send
+            source: The transcript text included in the prompt
+            task: Name of the extraction task, e.g. ``"summary"``
+            params: Task parameters that shape the response. The video ID is
+                not one of them: the content hash and prompt already tell
+                videos apart, and leaving it out lets the semantic cache
+                match a re-uploaded lecture
+            content_hash: Hash of the full transcript (see _hash_transcript)
+            generation_config: Optional generation settings for the call
+            parse: Optional function turning the response text into the
+                result; it raises if the response is unusable
+        """
+        # (key, scope) under which the response is cached, if caching
+        cache_slot: Optional[Tuple[str, str]] = None
+        if self._cache:
+            scope = LLMCache.make_scope(
+                self.model_name, task, dict(params, generation_config=generation_config)
+            )
+            key = LLMCache.make_key(scope, content_hash, prompt)
+            cache_slot = (key, scope)
+            cached = self._cache.lookup(self.model_name, key, scope, source)
+            if cached is not None:
+                if parse is None:
+                    return cached
+                try:
+                    return parse(cached)
+                except Exception as e:
+                    logger.debug(f"Discarding unparseable cached {task} response: {e}")
+        
+        if self._rate_limiter:
+            # Rough token estimate: about four characters per token
+            self._rate_limiter.wait(len(prompt) // 4)
+        
+        if generation_config:
+            response = self.model.generate_content(
+                prompt, generation_config=generation_config
+            )
+        else:
+            response = self.model.generate_content(prompt)
+        text = response.text
+        result = parse(text) if parse else text
         
-        Target length: Approximately {target_length} words
+        if self._cache and cache_slot is not None:
+            key, scope = cache_slot
+            self._cache.store(self.model_name, key, scope, source, text)
+        return result
+    
+    async def _generate_async(
+        self,
+        prompt: str,
+        source: str,
+        task: str,
+        params: Dict[str, Any],
+        content_hash: str,
+        generation_config: Optional[Dict[str, Any]] = None,
+        parse: Optional[Callable[[str], Any]] = None
+    ) -> Any:
+        """Run _generate in a worker thread.
+        
+        The SDK's async client is bound to the event loop it first ran on,
+        while process_transcript may be driven from several threads (one
+        event loop each), so the thread-safe sync client is used instead.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(
+            self._generate, prompt, source, task, params, content_hash,
+            generation_config, parse
+        ))
+    
+    async def _generate_overview(
+        self,
+        video_info: VideoInfo,
+        transcript: str,
+        summary_length: int,
+        key_concepts_limit: int,
+        content_hash: str
+    ) -> Dict[str, Any]:
+        """Generate every field of ProcessedContent except the chapters.
+        
+        A single JSON-mode call sends the transcript once instead of five
+        times. If the model does not support JSON mode, or that call fails
+        or its output cannot be parsed, the per-section prompts are issued
+        instead.
         
-        Focus on:
-        - Main topics and themes
-        - Key learning points
-        - Important concepts and definitions
-        - Practical applications or examples
+        Returns:
+            ProcessedContent keyword arguments, without ``chapters``
+        """
+        if _supports_json_mode(self.model_name):
+            try:
+                return await self._generate_combined_overview(
+                    video_info, transcript, summary_length, key_concepts_limit,
+                    content_hash
+                )
+            except Exception as e:
+                if InvalidArgument is not None and isinstance(e, InvalidArgument):
+                    # The model rejected the request itself, i.e. JSON mode
+                    _json_mode_rejected.add(self.model_name.split("/")[-1])
+                logger.warning(
+                    f"Combined overview generation failed, using per-section prompts: {e}"
+                )
+        
+        (
+            summary,
+            key_concepts,
+            main_topics,
+            learning_objectives,
+            questions
+        ) = await asyncio.gather(
+            self._generate_summary(video_info, transcript, summary_length, content_hash),
+            self._extract_key_concepts(
+                video_info, transcript, key_concepts_limit, content_hash
+            ),
+            self._extract_main_topics(video_info, transcript, content_hash),
+            self._generate_learning_objectives(video_info, transcript, content_hash),
+            self._generate_questions(video_info, transcript, content_hash)
+        )
+        
+        return {
+            'summary': summary,
+            'key_concepts': key_concepts,
+            'main_topics': main_topics,
+            'learning_objectives': learning_objectives,
+            'questions': questions
+        }
+    
+    async def _generate_combined_overview(
+        self,
+        video_info: VideoInfo,
+        transcript: str,
+        summary_length: int,
+        key_concepts_limit: int,
+        content_hash: str
+    ) -> Dict[str, Any]:
+        """Generate the overview fields with one JSON-mode call.
+        
+        Raises:
+            Exception: If the call fails or its output cannot be parsed
+        """
+        prompt = f"""{OVERVIEW_INSTRUCTIONS}
+Video Title: {video_info.title}
+Channel: {video_info.channel_title}
+Duration: {video_info.duration // 60} minutes
+
+Summary target length: Approximately {summary_length} words
+Number of key concepts: the top {key_concepts_limit}
+
+Transcript:
+{transcript[:TRANSCRIPT_PROMPT_CHARS]}
+
+JSON:
+"""
+        
+        return await self._generate_async(
+            prompt,
+            transcript[:TRANSCRIPT_PROMPT_CHARS],
+            "overview",
+            {
+                "summary_length": summary_length,
+                "key_concepts_limit": key_concepts_limit
+            },
+            content_hash,
+            JSON_GENERATION_CONFIG,
+            functools.partial(self._parse_overview, key_concepts_limit=key_concepts_limit)
+        )
+    
+    def _parse_overview(self, text: str, key_concepts_limit: int) -> Dict[str, Any]:
+        """Parse the combined overview response.
         
-        Transcript:
-        {transcript[:8000]}  # Limit to avoid token limits
+        With msgspec installed, parsing and shape validation happen in one
+        pass; otherwise the response is decoded with orjson (or json) and
+        checked field by field.
         
-        Summary:
+        Raises:
+            ValueError: If the response is not JSON of the expected shape
         """
+        payload = _JSON_FENCE_RE.sub('', text)
+        
+        if msgspec:
+            try:
+                decoded = msgspec.json.decode(payload, type=_OverviewSchema)
+            except msgspec.DecodeError as e:
+                raise ValueError(f"Invalid overview response: {e}")
+            data = msgspec.to_builtins(decoded)
+        else:
+            data = _json_loads(payload)
+        
+        summary = data['summary']
+        if not isinstance(summary, str):
+            raise ValueError("summary is not a string")
+        
+        key_concepts = [
+            KeyConcept(
+                term=str(concept['term']).strip(),
+                definition=str(concept['definition']).strip(),
+                importance=str(concept['importance']).strip()
+            )
+            for concept in data['key_concepts']
+        ]
+        
+        lists = {}
+        for field in ('main_topics', 'learning_objectives', 'questions'):
+            values = data[field]
+            if not isinstance(values, list):
+                raise ValueError(f"{field} is not a list")
+            lists[field] = [str(value).strip() for value in values if str(value).strip()]
+        
+        return {
+            'summary': summary.strip(),
+            'key_concepts': key_concepts[:key_concepts_limit],
+            'main_topics': lists['main_topics'][:8],
+            'learning_objectives': lists['learning_objectives'][:6],
+            'questions': lists['questions'][:8]
+        }
+    
+    async def _generate_summary(
+        self, video_info: VideoInfo, transcript: str, target_length: int, content_hash: str
+    ) -> str:
+        """Generate a concise summary of the lecture."""
+        prompt = f"""{SUMMARY_INSTRUCTIONS}
+Video Title: {video_info.title}
+Channel: {video_info.channel_title}
+Duration: {video_info.duration // 60} minutes
+
+Target length: Approximately {target_length} words
+
+Transcript:
+{transcript[:TRANSCRIPT_PROMPT_CHARS]}
+
+Summary:
+"""
         
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            text = await self._generate_async(
+                prompt,
+                transcript[:TRANSCRIPT_PROMPT_CHARS],
+                "summary",
+                {"summary_length": target_length},
+                content_hash
+            )
+            return text.strip()
         except Exception as e:
             logger.error(f"Summary generation failed: {e}")
             return "Summary generation failed. Please try again."
     
-    def _extract_key_concepts(
-        self, video_info: VideoInfo, transcript: str, limit: int
+    async def _extract_key_concepts(
+        self, video_info: VideoInfo, transcript: str, limit: int, content_hash: str
     ) -> List[KeyConcept]:
         """Extract key concepts and definitions from the lecture."""
-        prompt = f"""
-        Analyze this lecture transcript and extract the most important key concepts.
-        
-        Video Title: {video_info.title}
-        
-        For each concept, provide:
-        1. Term/Concept name
-        2. Clear definition or explanation
-        3. Why it's important in the context of this lecture
-        
-        Extract the top {limit} most important concepts.
-        
-        Format your response as:
-        CONCEPT: [Term]
-        DEFINITION: [Clear definition]
-        IMPORTANCE: [Why it matters]
-        ---
-        
-        Transcript:
-        {transcript[:8000]}
-        
-        Key Concepts:
-        """
+        prompt = f"""{KEY_CONCEPTS_INSTRUCTIONS}
+Video Title: {video_info.title}
+
+Extract the top {limit} most important concepts.
+
+Transcript:
+{transcript[:TRANSCRIPT_PROMPT_CHARS]}
+
+Key Concepts:
+"""
         
         try:
-            response = self.model.generate_content(prompt)
-            return self._parse_key_concepts(response.text)
+            text = await self._generate_async(
+                prompt,
+                transcript[:TRANSCRIPT_PROMPT_CHARS],
+                "key_concepts",
+                {"key_concepts_limit": limit},
+                content_hash
+            )
+            return self._parse_key_concepts(text)
         except Exception as e:
             logger.error(f"Key concept extraction failed: {e}")
             return []
@@ -214,144 +728,153 @@ class AIProcessor:
         concept_blocks = text.split('---')
         
         for block in concept_blocks:
-            block = block.strip()
-            if not block:
-                continue
-                
-            lines = block.split('\n')
-            concept_data = {}
-            
-            for line in lines:
-                if line.startswith('CONCEPT:'):
-                    concept_data['term'] = line.replace('CONCEPT:', '').strip()
-                elif line.startswith('DEFINITION:'):
-                    concept_data['definition'] = line.replace('DEFINITION:', '').strip()
-                elif line.startswith('IMPORTANCE:'):
-                    concept_data['importance'] = line.replace('IMPORTANCE:', '').strip()
+            concept_data = {
+                _CONCEPT_FIELDS[tag]: value.strip()
+                for tag, value in _CONCEPT_RE.findall(block)
+            }
             
-            if all(key in concept_data for key in ['term', 'definition', 'importance']):
+            if len(concept_data) == len(_CONCEPT_FIELDS):
                 concepts.append(KeyConcept(**concept_data))
         
         return concepts
     
-    def _generate_chapters(
-        self, video_info: VideoInfo, segments: List[TranscriptSegment], num_chapters: int
+    async def _generate_chapters(
+        self, video_info: VideoInfo, chapter_texts: List[str], content_hash: str
     ) -> List[Chapter]:
-        """Generate logical chapters for the lecture."""
+        """Generate logical chapters for the lecture.
+        
+        All chapter prompts are built up front and sent concurrently, with at
+        most ``MAX_CONCURRENT_CHAPTER_CALLS`` requests in flight at once.
+        
+        Args:
+            video_info: Video metadata
+            chapter_texts: Transcript text of each chapter's time window
+            content_hash: Hash of the full transcript, for cache keys
+        """
+        num_chapters = len(chapter_texts)
+        if not num_chapters:
+            return []
+        
         # Calculate chapter duration
         total_duration = video_info.duration
         chapter_duration = total_duration / num_chapters
         
-        chapters = []
-        full_transcript = self._combine_transcript(segments)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHAPTER_CALLS)
+        tasks = []
         
-        for i in range(num_chapters):
+        for i, chapter_text in enumerate(chapter_texts):
             start_time = i * chapter_duration
             end_time = min((i + 1) * chapter_duration, total_duration)
             
-            # Get transcript segment for this chapter
-            chapter_segments = [
-                seg for seg in segments 
-                if seg.start >= start_time and seg.start < end_time
-            ]
-            chapter_text = '\n'.join(seg.text for seg in chapter_segments)
-            
             if not chapter_text.strip():
                 continue
             
-            prompt = f"""
-            Create a chapter summary for this section of the lecture.
-            
-            Video: {video_info.title}
-            Chapter {i+1} of {num_chapters}
-            Time: {int(start_time//60)}:{int(start_time%60):02d} - {int(end_time//60)}:{int(end_time%60):02d}
-            
-            Provide:
-            1. A descriptive chapter title
-            2. A brief summary (2-3 sentences)
-            3. 3-5 key points covered in this section
-            
-            Format:
-            TITLE: [Chapter Title]
-            SUMMARY: [Brief summary]
-            KEY_POINTS:
-            - [Point 1]
-            - [Point 2]
-            - [Point 3]
-            
-            Chapter Content:
-            {chapter_text[:2000]}
-            """
+            prompt = self._build_chapter_prompt(
+                video_info, i, num_chapters, start_time, end_time, chapter_text
+            )
+            params = {"index": i, "num_chapters": num_chapters}
+            tasks.append(self._generate_chapter(
+                semaphore, prompt, chapter_text[:CHAPTER_PROMPT_CHARS], params,
+                content_hash, i, start_time, end_time
+            ))
+        
+        chapters = await asyncio.gather(*tasks)
+        return [chapter for chapter in chapters if chapter]
+    
+    def _build_chapter_prompt(
+        self,
+        video_info: VideoInfo,
+        index: int,
+        num_chapters: int,
+        start_time: float,
+        end_time: float,
+        chapter_text: str
+    ) -> str:
+        """Build the prompt for a single chapter."""
+        return f"""{CHAPTER_INSTRUCTIONS}
+Video: {video_info.title}
+Chapter {index+1} of {num_chapters}
+Time: {int(start_time//60)}:{int(start_time%60):02d} - {int(end_time//60)}:{int(end_time%60):02d}
+
+Chapter Content:
+{chapter_text[:CHAPTER_PROMPT_CHARS]}
+"""
+    
+    async def _generate_chapter(
+        self,
+        semaphore: asyncio.Semaphore,
+        prompt: str,
+        source: str,
+        params: Dict[str, Any],
+        content_hash: str,
+        index: int,
+        start_time: float,
+        end_time: float
+    ) -> Optional[Chapter]:
+        """Generate a single chapter, falling back to a placeholder on failure."""
+        try:
+            async with semaphore:
+                text = await self._generate_async(
+                    prompt, source, "chapter", params, content_hash
+                )
+            return self._parse_chapter(text, start_time, end_time)
             
-            try:
-                response = self.model.generate_content(prompt)
-                chapter = self._parse_chapter(response.text, start_time, end_time)
-                if chapter:
-                    chapters.append(chapter)
-                    
-                # Small delay to avoid rate limiting
-                time.sleep(0.5)
-                
-            except Exception as e:
-                logger.error(f"Chapter {i+1} generation failed: {e}")
-                # Create a fallback chapter
-                chapters.append(Chapter(
-                    title=f"Chapter {i+1}",
-                    start_time=start_time,
-                    end_time=end_time,
-                    summary="Content summary not available.",
-                    key_points=["Key points not available."]
-                ))
-        
-        return chapters
+        except Exception as e:
+            logger.error(f"Chapter {index+1} generation failed: {e}")
+            # Create a fallback chapter
+            return Chapter(
+                title=f"Chapter {index+1}",
+                start_time=start_time,
+                end_time=end_time,
+                summary="Content summary not available.",
+                key_points=["Key points not available."]
+            )
     
     def _parse_chapter(self, text: str, start_time: float, end_time: float) -> Optional[Chapter]:
         """Parse chapter information from AI response."""
-        lines = text.split('\n')
-        chapter_data = {
+        chapter_data: Dict[str, Any] = {
             'start_time': start_time,
             'end_time': end_time,
             'key_points': []
         }
         
-        current_section = None
+        for tag, value in _CHAPTER_FIELD_RE.findall(text):
+            chapter_data[tag.lower()] = value.strip()
         
-        for line in lines:
-            line = line.strip()
-            if line.startswith('TITLE:'):
-                chapter_data['title'] = line.replace('TITLE:', '').strip()
-            elif line.startswith('SUMMARY:'):
-                chapter_data['summary'] = line.replace('SUMMARY:', '').strip()
-            elif line.startswith('KEY_POINTS:'):
-                current_section = 'key_points'
-            elif line.startswith('- ') and current_section == 'key_points':
-                chapter_data['key_points'].append(line.replace('- ', '').strip())
+        # Only bullets after the KEY_POINTS: header are key points
+        header = _KEY_POINTS_RE.search(text)
+        if header:
+            points = (point.strip() for point in _BULLET_RE.findall(text, header.end()))
+            chapter_data['key_points'] = [point for point in points if point]
         
         if 'title' in chapter_data and 'summary' in chapter_data:
             return Chapter(**chapter_data)
         
         return None
     
-    def _extract_main_topics(self, video_info: VideoInfo, transcript: str) -> List[str]:
+    async def _extract_main_topics(
+        self, video_info: VideoInfo, transcript: str, content_hash: str
+    ) -> List[str]:
         """Extract main topics from the lecture."""
-        prompt = f"""
-        Identify the main topics covered in this lecture.
-        
-        Video: {video_info.title}
-        
-        List the 5-8 most important topics in order of importance.
-        Be concise - each topic should be 2-5 words.
-        
-        Transcript:
-        {transcript[:6000]}
-        
-        Main Topics:
-        """
+        prompt = f"""{MAIN_TOPICS_INSTRUCTIONS}
+Video: {video_info.title}
+
+Transcript:
+{transcript[:SHORT_TRANSCRIPT_PROMPT_CHARS]}
+
+Main Topics:
+"""
         
         try:
-            response = self.model.generate_content(prompt)
+            text = await self._generate_async(
+                prompt,
+                transcript[:SHORT_TRANSCRIPT_PROMPT_CHARS],
+                "main_topics",
+                {},
+                content_hash
+            )
             topics = []
-            for line in response.text.split('\n'):
+            for line in text.split('\n'):
                 line = line.strip()
                 if line and not line.startswith('#'):
                     # Remove numbering if present
@@ -363,28 +886,29 @@ class AIProcessor:
             logger.error(f"Main topics extraction failed: {e}")
             return []
     
-    def _generate_learning_objectives(self, video_info: VideoInfo, transcript: str) -> List[str]:
+    async def _generate_learning_objectives(
+        self, video_info: VideoInfo, transcript: str, content_hash: str
+    ) -> List[str]:
         """Generate learning objectives for the lecture."""
-        prompt = f"""
-        Based on this lecture content, create clear learning objectives.
-        
-        Video: {video_info.title}
-        
-        Generate 4-6 learning objectives that students should achieve after watching this lecture.
-        Start each objective with an action verb (understand, explain, analyze, apply, etc.).
-        
-        Format: "Students will be able to..."
-        
-        Transcript:
-        {transcript[:6000]}
-        
-        Learning Objectives:
-        """
+        prompt = f"""{LEARNING_OBJECTIVES_INSTRUCTIONS}
+Video: {video_info.title}
+
+Transcript:
+{transcript[:SHORT_TRANSCRIPT_PROMPT_CHARS]}
+
+Learning Objectives:
+"""
         
         try:
-            response = self.model.generate_content(prompt)
+            text = await self._generate_async(
+                prompt,
+                transcript[:SHORT_TRANSCRIPT_PROMPT_CHARS],
+                "learning_objectives",
+                {},
+                content_hash
+            )
             objectives = []
-            for line in response.text.split('\n'):
+            for line in text.split('\n'):
                 line = line.strip()
                 if line and (line.startswith('Students will') or line.startswith('-')):
                     objective = line.replace('- ', '').strip()
@@ -394,26 +918,29 @@ class AIProcessor:
             logger.error(f"Learning objectives generation failed: {e}")
             return []
     
-    def _generate_questions(self, video_info: VideoInfo, transcript: str) -> List[str]:
+    async def _generate_questions(
+        self, video_info: VideoInfo, transcript: str, content_hash: str
+    ) -> List[str]:
         """Generate review questions for the lecture."""
-        prompt = f"""
-        Create thoughtful review questions for this lecture.
-        
-        Video: {video_info.title}
-        
-        Generate 5-8 questions that test understanding of the key concepts.
-        Mix different types: factual, conceptual, and application questions.
-        
-        Transcript:
-        {transcript[:6000]}
-        
-        Review Questions:
-        """
+        prompt = f"""{QUESTIONS_INSTRUCTIONS}
+Video: {video_info.title}
+
+Transcript:
+{transcript[:SHORT_TRANSCRIPT_PROMPT_CHARS]}
+
+Review Questions:
+"""
         
         try:
-            response = self.model.generate_content(prompt)
+            text = await self._generate_async(
+                prompt,
+                transcript[:SHORT_TRANSCRIPT_PROMPT_CHARS],
+                "questions",
+                {},
+                content_hash
+            )
             questions = []
-            for line in response.text.split('\n'):
+            for line in text.split('\n'):
                 line = line.strip()
                 if line and ('?' in line):
                     # Remove numbering if present
@@ -1,17 +1,41 @@
 """Main LectureNotetaker class that orchestrates the entire process."""
 
-from typing import Optional, List, Tuple, Dict
-from dataclasses import dataclass
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, Awaitable, Optional, List, Tuple, Dict, TypeVar, Union
+from dataclasses import dataclass, replace
 
 from .transcript_extractor import TranscriptExtractor, VideoInfo, TranscriptSegment
 from .ai_processor import AIProcessor, ProcessedContent
 from .notion_client import NotionClient
-from ..utils.config import Config
+from ..utils.async_utils import run_sync
+from ..utils.compat import DATACLASS_SLOTS
+from ..utils.config import Config, get_config
 from ..utils.exceptions import LectureNotetakerError, ConfigurationError
+from ..utils.llm_cache import LLMCache, SemanticLLMCache
 from ..utils.logger import logger
+from ..utils.page_cache import PageCache
+from ..utils.rate_limit import TokenBucket
 
 
-@dataclass
+# Placeholder video info shared by every failed NoteResult; VideoInfo is
+# frozen and holds no mutable values. ProcessedContent holds lists, so each
+# failure gets its own (see LectureNotetaker._failed_result).
+EMPTY_VIDEO_INFO = VideoInfo(
+    id="", title="Error", description="", duration=0,
+    channel_title="", published_at="", view_count=0
+)
+
+_T = TypeVar("_T")
+
+# Number of extracted transcripts buffered ahead of the AI/Notion stage
+# when processing a playlist
+PLAYLIST_PREFETCH = 2
+
+
+@dataclass(**DATACLASS_SLOTS)
 class NoteResult:
     """Result of processing a lecture video."""
     video_info: VideoInfo
@@ -30,21 +54,87 @@ class LectureNotetaker:
         Args:
             config: Configuration object. If None, will load from environment
         """
-        self.config = config or Config.from_env()
-        self.config.validate()
+        if config is None:
+            config = get_config()
+        else:
+            config.validate()
+        self.config = config
         
-        # Initialize components
-        self.transcript_extractor = TranscriptExtractor(self.config.youtube_api_key)
-        self.ai_processor = AIProcessor(
+        logger.info("LectureNotetaker initialized successfully")
+    
+    # Components are created on first use, so callers that only need one of
+    # the services (e.g. get_video_info) never set up the others.
+    
+    @functools.cached_property
+    def transcript_extractor(self) -> TranscriptExtractor:
+        """YouTube transcript extractor."""
+        return TranscriptExtractor(
+            self.config.youtube_api_key, cache_dir=self.config.cache_dir or None
+        )
+    
+    @functools.cached_property
+    def ai_processor(self) -> AIProcessor:
+        """Gemini-backed transcript processor."""
+        return AIProcessor(
             self.config.google_ai_api_key, 
-            self.config.model_name
+            self.config.model_name,
+            cache=self._create_llm_cache(),
+            rate_limiter=self._create_rate_limiter()
         )
-        self.notion_client = NotionClient(
+    
+    @functools.cached_property
+    def notion_client(self) -> NotionClient:
+        """Notion client for the notes database."""
+        page_cache = None
+        if self.config.cache_dir:
+            page_cache = PageCache(os.path.join(self.config.cache_dir, "notion_pages"))
+        return NotionClient(
             self.config.notion_token, 
-            self.config.notion_database_id
+            self.config.notion_database_id,
+            page_cache=page_cache
+        )
+    
+    def _create_llm_cache(self) -> Optional[Union[LLMCache, SemanticLLMCache]]:
+        """Create the persistent model response cache, if caching is enabled."""
+        if not self.config.cache_dir:
+            return None
+        cache = LLMCache(
+            os.path.join(self.config.cache_dir, "llm.db"),
+            ttl=self.config.llm_cache_ttl
         )
+        if self.config.semantic_cache:
+            return SemanticLLMCache(
+                cache, threshold=self.config.semantic_cache_threshold
+            )
+        return cache
+    
+    def _create_rate_limiter(self) -> Optional[TokenBucket]:
+        """Create the Gemini rate limiter, unless disabled (gemini_rpm of 0)."""
+        if self.config.gemini_rpm <= 0:
+            return None
+        return TokenBucket(self.config.gemini_rpm, self.config.gemini_tpm or None)
+    
+    async def aclose(self) -> None:
+        """Close the connections opened on the running event loop.
         
-        logger.info("LectureNotetaker initialized successfully")
+        Callers of the async methods await this once they are done with the
+        loop; the synchronous methods do so themselves.
+        """
+        if "notion_client" in self.__dict__:
+            await self.notion_client.aclose()
+    
+    def _run(self, coro: Awaitable[_T]) -> _T:
+        """Run a coroutine to completion, closing connections afterwards.
+        
+        Works from a running event loop too (see run_sync).
+        """
+        async def run_and_close() -> _T:
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+        
+        return run_sync(run_and_close())
     
     def process_video(
         self,
@@ -70,22 +160,127 @@ class LectureNotetaker:
         Returns:
             NoteResult with processing results
         """
+        return self._run(self.process_video_async(
+            url,
+            title=title,
+            language=language,
+            summary_length=summary_length,
+            chapters=chapters,
+            key_concepts_limit=key_concepts_limit,
+            create_notion_page=create_notion_page
+        ))
+    
+    async def process_video_async(
+        self,
+        url: str,
+        title: Optional[str] = None,
+        language: str = 'en',
+        summary_length: Optional[int] = None,
+        chapters: Optional[int] = None,
+        key_concepts_limit: Optional[int] = None,
+        create_notion_page: bool = True
+    ) -> NoteResult:
+        """Async variant of process_video.
+        
+        The Notion page is created (with the video information) while the
+        transcript is being processed, and the notes are appended once the
+        AI results are in. If processing fails, the page is archived again.
+        
+        Args:
+            url: YouTube video URL
+            title: Custom title for the notes (optional)
+            language: Preferred transcript language
+            summary_length: Target summary length in words
+            chapters: Number of chapters to create
+            key_concepts_limit: Maximum number of key concepts
+            create_notion_page: Whether to create a Notion page
+            
+        Returns:
+            NoteResult with processing results
+        """
+        logger.info(f"Starting to process video: {url}")
+        
         try:
-            logger.info(f"Starting to process video: {url}")
+            video_info, transcript_segments = await self._extract_async(url, language, title)
+        except Exception as e:
+            return self._failed_result(url, e)
+        
+        return await self._create_notes_async(
+            url,
+            video_info,
+            transcript_segments,
+            summary_length=summary_length,
+            chapters=chapters,
+            key_concepts_limit=key_concepts_limit,
+            create_notion_page=create_notion_page
+        )
+    
+    async def _extract_async(
+        self,
+        url: str,
+        language: str = 'en',
+        title: Optional[str] = None,
+        video_info: Optional[VideoInfo] = None
+    ) -> Tuple[VideoInfo, List[TranscriptSegment]]:
+        """Fetch video info and transcript in a worker thread.
+        
+        Args:
+            url: YouTube video URL
+            language: Preferred transcript language
+            title: Custom title overriding the video's own (optional)
+            video_info: Already fetched video info; only the transcript is
+                fetched then (optional)
             
-            # Extract video info and transcript
-            video_info, transcript_segments = self.transcript_extractor.extract_from_url(
-                url, language
+        Returns:
+            Tuple of (VideoInfo, transcript segments)
+        """
+        loop = asyncio.get_running_loop()
+        if video_info is None:
+            extracted = await loop.run_in_executor(
+                None, self.transcript_extractor.extract_from_url, url, language
             )
-            
-            # Override title if provided
-            if title:
-                video_info.title = title
-            
-            logger.info(f"Extracted transcript with {len(transcript_segments)} segments")
+            video_info, transcript_segments = extracted
+        else:
+            transcript_segments = await loop.run_in_executor(
+                None, self.transcript_extractor.get_transcript, video_info.id, language
+            )
+        
+        # Override title if provided
+        if title:
+            video_info = replace(video_info, title=title)
+        
+        logger.info(f"Extracted transcript with {len(transcript_segments)} segments")
+        return video_info, transcript_segments
+    
+    async def _create_notes_async(
+        self,
+        url: str,
+        video_info: VideoInfo,
+        transcript_segments: List[TranscriptSegment],
+        summary_length: Optional[int] = None,
+        chapters: Optional[int] = None,
+        key_concepts_limit: Optional[int] = None,
+        create_notion_page: bool = True
+    ) -> NoteResult:
+        """Run the AI and Notion stages for an extracted transcript.
+        
+        The Notion page is created (with the video information) while the
+        transcript is being processed, and the notes are appended once the
+        AI results are in. If processing fails, the page is archived again.
+        For a video that already has a published page, the page is only
+        created once the notes turn out to differ from the published ones.
+        """
+        page_future = None
+        
+        try:
+            if create_notion_page and not self.notion_client.has_published_page(video_info):
+                # Create the page while the AI processing runs
+                page_future = asyncio.ensure_future(self.notion_client.acreate_page_shell(
+                    video_info, self.config.notion_page_title_template
+                ))
             
             # Process with AI
-            processed_content = self.ai_processor.process_transcript(
+            processed_content = await self.ai_processor.process_transcript_async(
                 video_info=video_info,
                 transcript_segments=transcript_segments,
                 summary_length=summary_length or self.config.summary_length,
@@ -97,13 +292,31 @@ class LectureNotetaker:
             
             notion_url = None
             if create_notion_page:
-                # Create Notion page
-                notion_url = self.notion_client.create_lecture_notes(
-                    video_info=video_info,
-                    processed_content=processed_content,
-                    page_title_template=self.config.notion_page_title_template
+                page_title = self.config.notion_page_title_template.format(
+                    title=video_info.title
                 )
-                logger.info(f"Created Notion page: {notion_url}")
+                notion_url = await self.notion_client.apublished_page_url(
+                    video_info, processed_content, page_title
+                )
+                if notion_url is not None:
+                    if page_future:
+                        # Same notes as an earlier run; drop the new page
+                        await self._discard_page(page_future)
+                    logger.info(f"Notes already published: {notion_url}")
+                else:
+                    if page_future is None:
+                        page_future = asyncio.ensure_future(
+                            self.notion_client.acreate_page_shell(
+                                video_info, self.config.notion_page_title_template
+                            )
+                        )
+                    page = await page_future
+                    await self.notion_client.afill_page(page["id"], processed_content)
+                    notion_url = page.get("url", "")
+                    self.notion_client.record_published_page(
+                        video_info, processed_content, page_title, page["id"], notion_url
+                    )
+                    logger.info(f"Created Notion page: {notion_url}")
             
             return NoteResult(
                 video_info=video_info,
@@ -113,24 +326,37 @@ class LectureNotetaker:
             )
             
         except Exception as e:
-            logger.error(f"Failed to process video {url}: {e}")
-            return NoteResult(
-                video_info=VideoInfo(
-                    id="", title="Error", description="", duration=0,
-                    channel_title="", published_at="", view_count=0
-                ),
-                processed_content=ProcessedContent(
-                    summary="", key_concepts=[], chapters=[],
-                    main_topics=[], learning_objectives=[], questions=[]
-                ),
-                success=False,
-                error_message=str(e)
-            )
+            if page_future:
+                await self._discard_page(page_future)
+            return self._failed_result(url, e)
+    
+    def _failed_result(self, url: str, error: Exception) -> NoteResult:
+        """Log a failure and build the NoteResult reporting it."""
+        logger.error(f"Failed to process video {url}: {error}")
+        return NoteResult(
+            video_info=EMPTY_VIDEO_INFO,
+            processed_content=ProcessedContent(
+                summary="", key_concepts=[], chapters=[],
+                main_topics=[], learning_objectives=[], questions=[]
+            ),
+            success=False,
+            error_message=str(error)
+        )
+    
+    async def _discard_page(self, page_future: "asyncio.Future[Dict]") -> None:
+        """Archive a page whose notes could not be completed, if it was created."""
+        try:
+            page = await page_future
+            await self.notion_client.aarchive_page(page["id"])
+            logger.info("Archived incomplete Notion page")
+        except Exception as e:
+            logger.warning(f"Could not clean up Notion page: {e}")
     
     def process_playlist(
         self,
         playlist_url: str,
         max_videos: Optional[int] = None,
+        max_concurrency: int = 5,
         **kwargs
     ) -> List[NoteResult]:
         """Process multiple videos from a YouTube playlist.
@@ -138,15 +364,113 @@ class LectureNotetaker:
         Args:
             playlist_url: YouTube playlist URL
             max_videos: Maximum number of videos to process
+            max_concurrency: Maximum number of videos processed at once
             **kwargs: Additional arguments passed to process_video
             
         Returns:
-            List of NoteResult objects
+            List of NoteResult objects, in completion order
         """
-        # This is a simplified implementation
-        # In a full implementation, you would extract video URLs from the playlist
-        logger.warning("Playlist processing not fully implemented yet")
-        return []
+        async def collect() -> List[NoteResult]:
+            return [
+                result async for result in self.process_playlist_async(
+                    playlist_url, max_videos, max_concurrency, **kwargs
+                )
+            ]
+        
+        return self._run(collect())
+    
+    async def process_playlist_async(
+        self,
+        playlist_url: str,
+        max_videos: Optional[int] = None,
+        max_concurrency: int = 5,
+        **kwargs
+    ) -> AsyncIterator[NoteResult]:
+        """Process playlist videos concurrently, yielding results as they finish.
+        
+        The information of all videos is fetched up front in batched API
+        calls. Transcripts are fetched by a single producer that runs ahead
+        of the AI and Notion stages, buffering up to ``PLAYLIST_PREFETCH``
+        videos, so the next transcript is ready when a worker frees up. At
+        most ``max_concurrency`` videos are in the AI/Notion stage at once.
+        
+        Args:
+            playlist_url: YouTube playlist URL
+            max_videos: Maximum number of videos to process
+            max_concurrency: Maximum number of videos processed at once
+            **kwargs: Additional arguments passed to process_video
+            
+        Yields:
+            NoteResult for each video, in completion order
+        """
+        loop = asyncio.get_running_loop()
+        
+        playlist_id = self.transcript_extractor.extract_playlist_id(playlist_url)
+        video_ids = await loop.run_in_executor(
+            None, self.transcript_extractor.get_playlist_video_ids, playlist_id, max_videos
+        )
+        logger.info(f"Found {len(video_ids)} videos in playlist {playlist_id}")
+        
+        if not video_ids:
+            return
+        
+        try:
+            video_infos = await loop.run_in_executor(
+                None, self.transcript_extractor.get_video_info_batch, video_ids
+            )
+        except Exception as e:
+            # Fall back to fetching each video's info on its own
+            logger.warning(f"Could not fetch playlist video info: {e}")
+            video_infos = {}
+        
+        language = kwargs.pop('language', 'en')
+        title = kwargs.pop('title', None)
+        num_workers = max(1, min(max_concurrency, len(video_ids)))
+        
+        # Extracted transcripts (or extraction errors) waiting for a worker;
+        # None tells a worker to stop
+        prefetched: asyncio.Queue = asyncio.Queue(maxsize=PLAYLIST_PREFETCH)
+        results: asyncio.Queue = asyncio.Queue()
+        
+        async def produce() -> None:
+            for video_id in video_ids:
+                url = f"https://www.youtube.com/watch?v={video_id}"
+                logger.info(f"Starting to process video: {url}")
+                extracted: Union[Tuple[VideoInfo, List[TranscriptSegment]], Exception]
+                try:
+                    extracted = await self._extract_async(
+                        url, language, title, video_infos.get(video_id)
+                    )
+                except Exception as e:
+                    extracted = e
+                await prefetched.put((url, extracted))
+            for _ in range(num_workers):
+                await prefetched.put(None)
+        
+        async def work() -> None:
+            while True:
+                item = await prefetched.get()
+                if item is None:
+                    return
+                url, extracted = item
+                try:
+                    if isinstance(extracted, Exception):
+                        raise extracted
+                    result = await self._create_notes_async(url, *extracted, **kwargs)
+                except Exception as e:
+                    # Every video must produce a result, or the consumer hangs
+                    result = self._failed_result(url, e)
+                await results.put(result)
+        
+        tasks = [asyncio.ensure_future(produce())]
+        tasks.extend(asyncio.ensure_future(work()) for _ in range(num_workers))
+        
+        try:
+            for _ in video_ids:
+                yield await results.get()
+        finally:
+            for task in tasks:
+                task.cancel()
     
     def get_video_info(self, url: str) -> VideoInfo:
         """Get video information without processing transcript.
@@ -163,38 +487,56 @@ class LectureNotetaker:
     def test_connections(self) -> Dict[str, bool]:
         """Test all API connections.
         
+        The probes are independent network calls, so they run concurrently.
+        
         Returns:
             Dictionary with connection test results
         """
+        probes = {
+            'youtube': self._probe_youtube,
+            'google_ai': self._probe_google_ai,
+            'notion': self._probe_notion,
+        }
+        
         results = {}
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = {executor.submit(probe): name for name, probe in probes.items()}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
         
-        # Test YouTube API
+        # Report in a stable order regardless of completion order
+        return {name: results[name] for name in probes}
+    
+    def _probe_youtube(self) -> bool:
+        """Test the YouTube API connection."""
         try:
-            self.transcript_extractor._init_youtube_service()
-            results['youtube'] = True
-            logger.info("YouTube API connection: OK")
+            if self.transcript_extractor.test_connection():
+                logger.info("YouTube API connection: OK")
+                return True
+            logger.error("YouTube API connection failed")
+            return False
         except Exception as e:
-            results['youtube'] = False
             logger.error(f"YouTube API connection failed: {e}")
-        
-        # Test Google AI API
+            return False
+    
+    def _probe_google_ai(self) -> bool:
+        """Test the Google AI API connection."""
         try:
             self.ai_processor._init_model()
-            results['google_ai'] = True
             logger.info("Google AI API connection: OK")
+            return True
         except Exception as e:
-            results['google_ai'] = False
             logger.error(f"Google AI API connection failed: {e}")
-        
-        # Test Notion API
+            return False
+    
+    def _probe_notion(self) -> bool:
+        """Test the Notion API connection."""
         try:
-            results['notion'] = self.notion_client.test_connection()
-            if results['notion']:
+            if self.notion_client.test_connection():
                 logger.info("Notion API connection: OK")
-            else:
-                logger.error("Notion API connection failed")
+                return True
+            logger.error("Notion API connection failed")
+            return False
         except Exception as e:
-            results['notion'] = False
             logger.error(f"Notion API connection failed: {e}")
-        
-        return results
+            return False
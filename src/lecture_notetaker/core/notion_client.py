@@ -1,29 +1,135 @@
 """Notion API client for creating and managing lecture notes."""
 
+import asyncio
+import itertools
+import threading
 import time
-from typing import Dict, List, Optional, Any
+import weakref
+from typing import Any, Awaitable, Dict, Iterator, List, Optional, Tuple, TypeVar
 from datetime import datetime
 
 try:
-    from notion_client import Client
+    import httpx
+    from notion_client import AsyncClient, Client
 except ImportError:
+    httpx = None
+    AsyncClient = None
     Client = None
 
+try:
+    import h2  # noqa: F401 - lets httpx speak HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from .ai_processor import ProcessedContent, KeyConcept, Chapter
 from .transcript_extractor import VideoInfo
+from ..utils.async_utils import run_sync
 from ..utils.exceptions import NotionAPIError
 from ..utils.logger import logger
+from ..utils.page_cache import PageCache
+from ..utils.rate_limit import TokenBucket
+
+_T = TypeVar("_T")
+
+# Maximum number of child blocks the Notion API accepts per request
+NOTION_CHILDREN_LIMIT = 100
+
+# Concurrent append requests per page, kept within Notion's ~3 requests/s
+NOTION_APPEND_WORKERS = 3
+
+# Notion's average request rate limit per integration (requests per second)
+NOTION_REQUESTS_PER_SECOND = 3
+
+# Times a request is retried when the connection cannot be established
+NOTION_CONNECT_RETRIES = 2
+
+# Notion rejects rich text objects longer than 2000 characters; stay a little
+# below, since the API counts some characters (e.g. emoji) as two
+NOTION_TEXT_LIMIT = 1900
+
+# Blocks are only serialized, never modified, so one divider can be shared
+_DIVIDER = {"object": "block", "type": "divider", "divider": {}}
+
+
+# Annotation objects keyed by (bold, italic), shared across rich text runs
+# for the same reason
+_ANNOTATIONS: Dict[Tuple[bool, bool], Dict[str, bool]] = {
+    (True, False): {"bold": True},
+    (False, True): {"italic": True},
+    (True, True): {"bold": True, "italic": True},
+}
+
+
+def _rich_text(content: str, bold: bool = False, italic: bool = False) -> Dict[str, Any]:
+    """Create a rich text object, with annotations only when needed."""
+    if bold or italic:
+        return {
+            "type": "text",
+            "text": {"content": content},
+            "annotations": _ANNOTATIONS[bool(bold), bool(italic)],
+        }
+    return {"type": "text", "text": {"content": content}}
+
+
+def _chunk_text(content: str, limit: int = NOTION_TEXT_LIMIT) -> List[str]:
+    """Split text into pieces that each fit in one rich text object."""
+    if len(content) <= limit:
+        return [content]
+    return [content[i:i + limit] for i in range(0, len(content), limit)]
+
+
+def _property_value(prop_type: str, value: Any) -> Dict[str, Any]:
+    """Create a page property value of the given database column type."""
+    if prop_type == "rich_text":
+        return {"rich_text": [_rich_text(piece) for piece in _chunk_text(str(value))]}
+    if prop_type == "select":
+        # Select option names may not contain commas
+        return {"select": {"name": str(value).replace(",", " ")[:100]}}
+    if prop_type == "date":
+        return {"date": {"start": value}}
+    return {prop_type: value}
+
+
+def _format_timestamp(seconds: float) -> str:
+    """Format a non-negative offset in seconds as ``m:ss``."""
+    minutes, secs = divmod(int(seconds), 60)
+    return f"{minutes}:{secs:02d}"
+
+
+def _block(kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a block of the given type."""
+    return {"object": "block", "type": kind, kind: payload}
+
+
+def _text_runs(content: str, bold: bool = False, italic: bool = False) -> List[Dict[str, Any]]:
+    """Create the rich text runs for a piece of text.
+    
+    Long content is split over several runs, so each stays within Notion's
+    per-run length limit.
+    """
+    if len(content) <= NOTION_TEXT_LIMIT:
+        return [_rich_text(content, bold, italic)]
+    return [_rich_text(piece, bold, italic) for piece in _chunk_text(content)]
+
+
+def _text_block(kind: str, content: str, bold: bool = False, italic: bool = False) -> Dict[str, Any]:
+    """Create a text block (paragraph, heading, list item)."""
+    return _block(kind, {"rich_text": _text_runs(content, bold, italic)})
 
 
 class NotionClient:
     """Client for interacting with Notion API."""
     
-    def __init__(self, token: str, database_id: str):
+    def __init__(self, token: str, database_id: str, page_cache: Optional[PageCache] = None):
         """Initialize the Notion client.
         
         Args:
             token: Notion integration token
             database_id: ID of the database to store notes
+            page_cache: Optional record of published pages; create_lecture_notes
+                returns the existing page instead of publishing the same
+                notes twice
         """
         if not Client:
             raise NotionAPIError(
@@ -32,18 +138,80 @@ class NotionClient:
             
         self.token = token
         self.database_id = database_id
+        self.page_cache = page_cache
         self.client = None
+        # Shared by every request this client makes, sync or async, so that
+        # concurrent pages queue up instead of running into 429 backoff
+        self._rate_limiter = TokenBucket(
+            NOTION_REQUESTS_PER_SECOND * 60, burst=NOTION_REQUESTS_PER_SECOND
+        )
+        self._db_schema: Optional[Dict[str, Any]] = None
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_clients_lock = threading.Lock()
         self._init_client()
     
     def _init_client(self) -> None:
-        """Initialize the Notion client."""
+        """Initialize the Notion client.
+        
+        Requests go over HTTP/2 when the ``h2`` package is installed, so the
+        concurrent appends of one page share a single connection.
+        """
         try:
-            self.client = Client(auth=self.token)
+            self.client = Client(auth=self.token, client=httpx.Client(
+                transport=httpx.HTTPTransport(
+                    http2=HTTP2_AVAILABLE, retries=NOTION_CONNECT_RETRIES
+                )
+            ))
             logger.info("Notion client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Notion client: {e}")
             raise NotionAPIError(f"Notion client initialization failed: {e}")
     
+    def _get_async_client(self) -> "AsyncClient":
+        """Return the async client for the running event loop.
+        
+        An AsyncClient's connection pool is bound to the event loop it was
+        first used on, so one client is kept per loop and reused by every
+        request made on that loop, until aclose is awaited on it.
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._async_clients[loop] = AsyncClient(
+                    auth=self.token,
+                    client=httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(
+                        http2=HTTP2_AVAILABLE, retries=NOTION_CONNECT_RETRIES
+                    ))
+                )
+        return client
+    
+    async def aclose(self) -> None:
+        """Close the async client of the running event loop, if one was opened.
+        
+        Callers of the async methods await this once they are done with the
+        loop; the synchronous wrappers do so themselves.
+        """
+        with self._async_clients_lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+    
+    def _run(self, coro: Awaitable[_T]) -> _T:
+        """Run a coroutine to completion, closing its loop's client afterwards.
+        
+        Works from a running event loop too (see run_sync).
+        """
+        async def run_and_close() -> _T:
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+        
+        return run_sync(run_and_close())
+    
     def create_lecture_notes(
         self,
         video_info: VideoInfo,
@@ -52,6 +220,8 @@ class NotionClient:
     ) -> str:
         """Create a comprehensive lecture notes page in Notion.
         
+        Synchronous wrapper around acreate_lecture_notes.
+        
         Args:
             video_info: Video metadata
             processed_content: AI-processed content
@@ -63,53 +233,371 @@ class NotionClient:
         Raises:
             NotionAPIError: If page creation fails
         """
+        return self._run(self.acreate_lecture_notes(
+            video_info, processed_content, page_title_template
+        ))
+    
+    async def acreate_lecture_notes(
+        self,
+        video_info: VideoInfo,
+        processed_content: ProcessedContent,
+        page_title_template: str = "📚 {title} - Lecture Notes"
+    ) -> str:
+        """Async variant of create_lecture_notes."""
         try:
+            client = self._get_async_client()
+            
             # Generate page title
             page_title = page_title_template.format(title=video_info.title)
             
-            # Create the page
-            page = self.client.pages.create(
+            cached_url = await self.apublished_page_url(
+                video_info, processed_content, page_title
+            )
+            if cached_url is not None:
+                logger.info(f"Notes already published: {cached_url}")
+                return cached_url
+            
+            blocks = self._create_page_content(video_info, processed_content)
+            schema = await self._aget_db_schema(client)
+            
+            # Create the page with as many blocks as one request allows
+            await self._rate_limiter.acquire()
+            page = await client.pages.create(
                 parent={"database_id": self.database_id},
-                properties=self._create_page_properties(video_info, page_title),
-                children=self._create_page_content(video_info, processed_content)
+                properties=self._create_page_properties(video_info, page_title, schema),
+                children=blocks[:NOTION_CHILDREN_LIMIT]
             )
+            try:
+                await self._append_blocks(
+                    client, page["id"], blocks[NOTION_CHILDREN_LIMIT:]
+                )
+            except Exception:
+                # Don't leave a truncated page behind in the database
+                try:
+                    await self.aarchive_page(page["id"])
+                    logger.info("Archived incomplete Notion page")
+                except NotionAPIError as archive_error:
+                    logger.warning(f"Could not clean up Notion page: {archive_error}")
+                raise
             
             page_url = page.get("url", "")
             logger.info(f"Created Notion page: {page_url}")
+            self.record_published_page(
+                video_info, processed_content, page_title, page["id"], page_url
+            )
             return page_url
             
         except Exception as e:
             logger.error(f"Failed to create Notion page: {e}")
             raise NotionAPIError(f"Page creation failed: {e}")
     
-    def _create_page_properties(self, video_info: VideoInfo, title: str) -> Dict[str, Any]:
+    def published_page_url(
+        self, video_info: VideoInfo, processed_content: ProcessedContent, page_title: str
+    ) -> Optional[str]:
+        """Return the URL these notes were already published at, if known.
+        
+        The page is looked up in Notion first; if it has since been deleted
+        (archived or moved to the trash), it is forgotten and None is
+        returned, so the notes get published again. Always None without a
+        page cache. Synchronous wrapper around apublished_page_url.
+        """
+        return self._run(self.apublished_page_url(
+            video_info, processed_content, page_title
+        ))
+    
+    async def apublished_page_url(
+        self, video_info: VideoInfo, processed_content: ProcessedContent, page_title: str
+    ) -> Optional[str]:
+        """Async variant of published_page_url."""
+        if self.page_cache is None:
+            return None
+        key = self.page_cache.make_key(
+            self.database_id, video_info.id, page_title, processed_content
+        )
+        entry = self.page_cache.get(key)
+        if entry is None:
+            return None
+        
+        page_id, page_url = entry
+        if page_id is not None and not await self._apage_exists(page_id):
+            logger.info(f"Published page was deleted, publishing again: {page_url}")
+            self.page_cache.delete(key)
+            return None
+        return page_url
+    
+    async def _apage_exists(self, page_id: str) -> bool:
+        """Return whether a page still exists and is not archived or trashed.
+        
+        If Notion cannot be asked, the page is assumed to exist.
+        """
+        try:
+            await self._rate_limiter.acquire()
+            page = await self._get_async_client().pages.retrieve(page_id=page_id)
+        except Exception as e:
+            if getattr(e, "code", None) == "object_not_found":
+                return False
+            logger.warning(f"Could not check published Notion page: {e}")
+            return True
+        return not (page.get("archived") or page.get("in_trash"))
+    
+    def has_published_page(self, video_info: VideoInfo) -> bool:
+        """Return whether a page was published for the video (needs a page cache).
+        
+        Unlike published_page_url this needs neither the processed content
+        nor a request, so it can be asked before processing starts.
+        """
+        if self.page_cache is None:
+            return False
+        return self.page_cache.has_video(
+            self.page_cache.make_video_key(self.database_id, video_info.id)
+        )
+    
+    def record_published_page(
+        self,
+        video_info: VideoInfo,
+        processed_content: ProcessedContent,
+        page_title: str,
+        page_id: str,
+        page_url: str
+    ) -> None:
+        """Remember the page the notes were published as (needs a page cache)."""
+        if self.page_cache is None:
+            return
+        self.page_cache.set(
+            self.page_cache.make_key(
+                self.database_id, video_info.id, page_title, processed_content
+            ),
+            page_id,
+            page_url,
+            self.page_cache.make_video_key(self.database_id, video_info.id)
+        )
+    
+    def create_page_shell(
+        self,
+        video_info: VideoInfo,
+        page_title_template: str = "📚 {title} - Lecture Notes"
+    ) -> Dict[str, Any]:
+        """Create a lecture notes page holding only the video information.
+        
+        The rest of the notes is added later with fill_page, so the page can
+        be created while the transcript is still being processed.
+        Synchronous wrapper around acreate_page_shell.
+        
+        Args:
+            video_info: Video metadata
+            page_title_template: Template for page title
+            
+        Returns:
+            The created page object (with ``id`` and ``url``)
+            
+        Raises:
+            NotionAPIError: If page creation fails
+        """
+        return self._run(self.acreate_page_shell(video_info, page_title_template))
+    
+    async def acreate_page_shell(
+        self,
+        video_info: VideoInfo,
+        page_title_template: str = "📚 {title} - Lecture Notes"
+    ) -> Dict[str, Any]:
+        """Async variant of create_page_shell."""
+        try:
+            client = self._get_async_client()
+            page_title = page_title_template.format(title=video_info.title)
+            schema = await self._aget_db_schema(client)
+            
+            await self._rate_limiter.acquire()
+            return await client.pages.create(
+                parent={"database_id": self.database_id},
+                properties=self._create_page_properties(video_info, page_title, schema),
+                children=list(self._create_header_section(video_info))
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to create Notion page: {e}")
+            raise NotionAPIError(f"Page creation failed: {e}")
+    
+    def fill_page(self, page_id: str, processed_content: ProcessedContent) -> None:
+        """Append the processed notes to a page created by create_page_shell.
+        
+        Synchronous wrapper around afill_page.
+        
+        Args:
+            page_id: ID of the page
+            processed_content: AI-processed content
+            
+        Raises:
+            NotionAPIError: If the content cannot be added
+        """
+        self._run(self.afill_page(page_id, processed_content))
+    
+    async def afill_page(self, page_id: str, processed_content: ProcessedContent) -> None:
+        """Async variant of fill_page."""
+        try:
+            await self._append_blocks(
+                self._get_async_client(),
+                page_id,
+                self._create_body_content(processed_content)
+            )
+        except Exception as e:
+            logger.error(f"Failed to add content to Notion page: {e}")
+            raise NotionAPIError(f"Adding page content failed: {e}")
+    
+    async def _append_blocks(
+        self, client: "AsyncClient", block_id: str, blocks: List[Dict[str, Any]]
+    ) -> None:
+        """Append blocks to a page or block, in requests of at most 100 blocks.
+        
+        Appending chunks concurrently would interleave them, so with three or
+        more chunks the first block of every chunk is appended in a single
+        request, and the rest of each chunk is then inserted after its own
+        first block, with up to ``NOTION_APPEND_WORKERS`` requests in flight.
+        With fewer chunks there is nothing to gain and they are sent one
+        after another.
+        """
+        chunks = [
+            blocks[i:i + NOTION_CHILDREN_LIMIT]
+            for i in range(0, len(blocks), NOTION_CHILDREN_LIMIT)
+        ]
+        
+        if len(chunks) < 3 or len(chunks) > NOTION_CHILDREN_LIMIT:
+            for chunk in chunks:
+                await self._rate_limiter.acquire()
+                await client.blocks.children.append(block_id=block_id, children=chunk)
+            return
+        
+        await self._rate_limiter.acquire()
+        response = await client.blocks.children.append(
+            block_id=block_id,
+            children=[chunk[0] for chunk in chunks]
+        )
+        anchors = [block["id"] for block in response["results"]]
+        if len(anchors) != len(chunks):
+            raise NotionAPIError("Unexpected response when appending blocks")
+        
+        semaphore = asyncio.Semaphore(NOTION_APPEND_WORKERS)
+        
+        async def append_after(anchor: str, children: List[Dict[str, Any]]) -> None:
+            async with semaphore:
+                await self._rate_limiter.acquire()
+                await client.blocks.children.append(
+                    block_id=block_id, children=children, after=anchor
+                )
+        
+        await asyncio.gather(*(
+            append_after(anchor, chunk[1:])
+            for chunk, anchor in zip(chunks, anchors)
+            if len(chunk) > 1
+        ))
+    
+    def archive_page(self, page_id: str) -> None:
+        """Archive (delete) a page, e.g. one whose notes could not be completed.
+        
+        Synchronous wrapper around aarchive_page.
+        
+        Args:
+            page_id: ID of the page
+            
+        Raises:
+            NotionAPIError: If the page cannot be archived
+        """
+        self._run(self.aarchive_page(page_id))
+    
+    async def aarchive_page(self, page_id: str) -> None:
+        """Async variant of archive_page."""
+        try:
+            await self._rate_limiter.acquire()
+            await self._get_async_client().pages.update(page_id=page_id, archived=True)
+        except Exception as e:
+            logger.error(f"Failed to archive Notion page: {e}")
+            raise NotionAPIError(f"Page archiving failed: {e}")
+    
+    def _create_page_properties(
+        self, video_info: VideoInfo, title: str, schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """Create page properties for the database.
         
         Args:
             video_info: Video metadata
             title: Page title
+            schema: Database property schema (fetched if not given)
             
         Returns:
             Dictionary of page properties
         """
-        # Use only the most basic property that every Notion database has
-        properties = {
-            "Name": {
+        if schema is None:
+            schema = self._get_db_schema()
+        
+        # Every database has exactly one title property, though not
+        # necessarily called "Name"
+        title_property = next(
+            (name for name, prop in schema.items() if prop.get("type") == "title"),
+            "Name"
+        )
+        properties: Dict[str, Any] = {
+            title_property: {
                 "title": [
                     {
                         "text": {
-                            "content": title
+                            "content": piece
                         }
                     }
+                    for piece in _chunk_text(title)
                 ]
             }
         }
         
-        # Don't add any other properties since they might not exist in the user's database
-        # The video URL and other info will be included in the page content instead
+        # Fill in video metadata for the columns the database actually has,
+        # in the format of each column's type
+        video_url = f"https://www.youtube.com/watch?v={video_info.id}"
+        published = video_info.published_at[:10]
+        metadata = {
+            "url": {"url": video_url, "rich_text": video_url},
+            "channel": {"rich_text": video_info.channel_title, "select": video_info.channel_title},
+            "duration": {
+                "number": round(video_info.duration / 60, 1),
+                "rich_text": _format_timestamp(video_info.duration)
+            },
+            "views": {"number": video_info.view_count},
+            "published": {"date": published, "rich_text": published},
+        }
+        
+        for name, prop in schema.items():
+            values = metadata.get(name.lower())
+            prop_type = prop.get("type")
+            value = values.get(prop_type) if values else None
+            if value is not None and value != "":
+                properties[name] = _property_value(prop_type, value)
         
         return properties
     
+    def _get_db_schema(self) -> Dict[str, Any]:
+        """Return the database's property schema, fetching it once.
+        
+        Returns an empty schema (title only) if the database cannot be read.
+        """
+        if self._db_schema is None:
+            try:
+                self._rate_limiter.wait()
+                database = self.client.databases.retrieve(database_id=self.database_id)
+                self._db_schema = database.get("properties", {})
+            except Exception as e:
+                logger.warning(f"Could not read Notion database schema: {e}")
+                return {}
+        return self._db_schema
+    
+    async def _aget_db_schema(self, client: "AsyncClient") -> Dict[str, Any]:
+        """Async variant of _get_db_schema."""
+        if self._db_schema is None:
+            try:
+                await self._rate_limiter.acquire()
+                database = await client.databases.retrieve(database_id=self.database_id)
+                self._db_schema = database.get("properties", {})
+            except Exception as e:
+                logger.warning(f"Could not read Notion database schema: {e}")
+                return {}
+        return self._db_schema
+    
     def _create_page_content(
         self, video_info: VideoInfo, processed_content: ProcessedContent
     ) -> List[Dict[str, Any]]:
@@ -122,454 +610,133 @@ class NotionClient:
         Returns:
             List of Notion blocks
         """
-        blocks = []
-        
-        # Header with video information
-        blocks.extend(self._create_header_section(video_info))
-        
-        # Summary section
-        blocks.extend(self._create_summary_section(processed_content.summary))
-        
-        # Learning objectives
-        if processed_content.learning_objectives:
-            blocks.extend(self._create_learning_objectives_section(
-                processed_content.learning_objectives
-            ))
-        
-        # Main topics
-        if processed_content.main_topics:
-            blocks.extend(self._create_main_topics_section(processed_content.main_topics))
-        
-        # Key concepts
-        if processed_content.key_concepts:
-            blocks.extend(self._create_key_concepts_section(processed_content.key_concepts))
-        
-        # Chapters
-        if processed_content.chapters:
-            blocks.extend(self._create_chapters_section(processed_content.chapters))
-        
-        # Review questions
-        if processed_content.questions:
-            blocks.extend(self._create_questions_section(processed_content.questions))
-        
-        # Footer
-        blocks.extend(self._create_footer_section())
+        return list(itertools.chain(
+            self._create_header_section(video_info),
+            self._iter_body_content(processed_content),
+        ))
+    
+    def _create_body_content(self, processed_content: ProcessedContent) -> List[Dict[str, Any]]:
+        """Create the blocks that follow the header section.
         
-        return blocks
+        Args:
+            processed_content: AI-processed content
+            
+        Returns:
+            List of Notion blocks
+        """
+        return list(self._iter_body_content(processed_content))
     
-    def _create_header_section(self, video_info: VideoInfo) -> List[Dict[str, Any]]:
+    def _iter_body_content(self, processed_content: ProcessedContent) -> Iterator[Dict[str, Any]]:
+        """Chain the body sections lazily; empty sections yield no blocks."""
+        return itertools.chain(
+            self._create_summary_section(processed_content.summary),
+            self._create_learning_objectives_section(processed_content.learning_objectives),
+            self._create_main_topics_section(processed_content.main_topics),
+            self._create_key_concepts_section(processed_content.key_concepts),
+            self._create_chapters_section(processed_content.chapters),
+            self._create_questions_section(processed_content.questions),
+            self._create_footer_section(),
+        )
+    
+    def _create_header_section(self, video_info: VideoInfo) -> Iterator[Dict[str, Any]]:
         """Create header section with video info."""
-        blocks = []
-        
-        # Video title as heading
-        blocks.append({
-            "object": "block",
-            "type": "heading_1",
-            "heading_1": {
-                "rich_text": [
-                    {
-                        "type": "text",
-                        "text": {
-                            "content": video_info.title
-                        }
-                    }
-                ]
-            }
-        })
-        
         # Video metadata
-        duration_str = f"{video_info.duration // 60}:{video_info.duration % 60:02d}"
+        duration_str = _format_timestamp(video_info.duration)
         metadata_text = (
             f"📺 **Channel:** {video_info.channel_title}\n"
             f"⏱️ **Duration:** {duration_str}\n"
-            f"📅 **Published:** {video_info.published_at.split('T')[0]}\n"
+            f"📅 **Published:** {video_info.published_at[:10]}\n"
             f"👀 **Views:** {video_info.view_count:,}\n"
             f"🔗 **URL:** https://www.youtube.com/watch?v={video_info.id}"
         )
         
-        blocks.append({
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [
-                    {
-                        "type": "text",
-                        "text": {
-                            "content": metadata_text
-                        }
-                    }
-                ]
-            }
-        })
-        
-        # Divider
-        blocks.append({
-            "object": "block",
-            "type": "divider",
-            "divider": {}
-        })
-        
-        return blocks
+        yield _text_block("heading_1", video_info.title)
+        yield _text_block("paragraph", metadata_text)
+        yield _DIVIDER
     
-    def _create_summary_section(self, summary: str) -> List[Dict[str, Any]]:
+    def _create_summary_section(self, summary: str) -> Iterator[Dict[str, Any]]:
         """Create summary section."""
-        blocks = []
-        
-        blocks.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [
-                    {
-                        "type": "text",
-                        "text": {
-                            "content": "📋 Summary"
-                        }
-                    }
-                ]
-            }
-        })
+        yield _text_block("heading_2", "📋 Summary")
         
         # Split summary into paragraphs if it's long
-        paragraphs = summary.split('\n\n')
-        for paragraph in paragraphs:
-            if paragraph.strip():
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": paragraph.strip()
-                                }
-                            }
-                        ]
-                    }
-                })
-        
-        return blocks
+        for paragraph in summary.split('\n\n'):
+            paragraph = paragraph.strip()
+            if paragraph:
+                yield _text_block("paragraph", paragraph)
     
-    def _create_learning_objectives_section(self, objectives: List[str]) -> List[Dict[str, Any]]:
+    def _create_learning_objectives_section(self, objectives: List[str]) -> Iterator[Dict[str, Any]]:
         """Create learning objectives section."""
-        blocks = []
-        
-        blocks.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [
-                    {
-                        "type": "text",
-                        "text": {
-                            "content": "🎯 Learning Objectives"
-                        }
-                    }
-                ]
-            }
-        })
-        
-        # Create bulleted list
+        if not objectives:
+            return
+        yield _text_block("heading_2", "🎯 Learning Objectives")
         for objective in objectives:
-            blocks.append({
-                "object": "block",
-                "type": "bulleted_list_item",
-                "bulleted_list_item": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": objective
-                            }
-                        }
-                    ]
-                }
-            })
-        
-        return blocks
+            yield _text_block("bulleted_list_item", objective)
     
-    def _create_main_topics_section(self, topics: List[str]) -> List[Dict[str, Any]]:
+    def _create_main_topics_section(self, topics: List[str]) -> Iterator[Dict[str, Any]]:
         """Create main topics section."""
-        blocks = []
-        
-        blocks.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [
-                    {
-                        "type": "text",
-                        "text": {
-                            "content": "📚 Main Topics"
-                        }
-                    }
-                ]
-            }
-        })
-        
-        # Create numbered list
-        for i, topic in enumerate(topics, 1):
-            blocks.append({
-                "object": "block",
-                "type": "numbered_list_item",
-                "numbered_list_item": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": topic
-                            }
-                        }
-                    ]
-                }
-            })
-        
-        return blocks
+        if not topics:
+            return
+        yield _text_block("heading_2", "📚 Main Topics")
+        for topic in topics:
+            yield _text_block("numbered_list_item", topic)
     
-    def _create_key_concepts_section(self, concepts: List[KeyConcept]) -> List[Dict[str, Any]]:
+    def _create_key_concepts_section(self, concepts: List[KeyConcept]) -> Iterator[Dict[str, Any]]:
         """Create key concepts section."""
-        blocks = []
-        
-        blocks.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [
-                    {
-                        "type": "text",
-                        "text": {
-                            "content": "🔑 Key Concepts"
-                        }
-                    }
-                ]
-            }
-        })
+        if not concepts:
+            return
+        yield _text_block("heading_2", "🔑 Key Concepts")
         
         for concept in concepts:
-            # Concept term as heading
-            blocks.append({
-                "object": "block",
-                "type": "heading_3",
-                "heading_3": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": concept.term
-                            },
-                            "annotations": {
-                                "bold": True
-                            }
-                        }
-                    ]
-                }
-            })
-            
-            # Definition
-            blocks.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": f"**Definition:** {concept.definition}"
-                            }
-                        }
-                    ]
-                }
-            })
-            
-            # Importance
-            blocks.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": f"**Why it matters:** {concept.importance}"
-                            }
-                        }
-                    ]
-                }
-            })
-        
-        return blocks
+            yield _text_block("heading_3", concept.term, bold=True)
+            # Definition and importance share one block, as separate runs
+            yield _block("paragraph", {"rich_text": [
+                *_text_runs("Definition: ", bold=True),
+                *_text_runs(f"{concept.definition}\n"),
+                *_text_runs("Why it matters: ", bold=True),
+                *_text_runs(concept.importance),
+            ]})
     
-    def _create_chapters_section(self, chapters: List[Chapter]) -> List[Dict[str, Any]]:
+    def _create_chapters_section(self, chapters: List[Chapter]) -> Iterator[Dict[str, Any]]:
         """Create chapters section."""
-        blocks = []
-        
-        blocks.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [
-                    {
-                        "type": "text",
-                        "text": {
-                            "content": "📖 Chapters"
-                        }
-                    }
-                ]
-            }
-        })
+        if not chapters:
+            return
+        yield _text_block("heading_2", "📖 Chapters")
         
         for i, chapter in enumerate(chapters, 1):
             # Chapter title with timestamp
-            start_min = int(chapter.start_time // 60)
-            start_sec = int(chapter.start_time % 60)
-            end_min = int(chapter.end_time // 60)
-            end_sec = int(chapter.end_time % 60)
-            
-            chapter_title = f"{i}. {chapter.title} ({start_min}:{start_sec:02d} - {end_min}:{end_sec:02d})"
+            time_range = f"{_format_timestamp(chapter.start_time)} - {_format_timestamp(chapter.end_time)}"
+            chapter_title = f"{i}. {chapter.title} ({time_range})"
             
-            blocks.append({
-                "object": "block",
-                "type": "heading_3",
-                "heading_3": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": chapter_title
-                            }
-                        }
-                    ]
-                }
-            })
+            yield _text_block("heading_3", chapter_title)
             
-            # Chapter summary
-            blocks.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": chapter.summary
-                            }
-                        }
-                    ]
-                }
-            })
-            
-            # Key points
             if chapter.key_points:
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": "**Key Points:**"
-                                },
-                                "annotations": {
-                                    "bold": True
-                                }
-                            }
-                        ]
-                    }
-                })
-                
+                # The key points heading goes in the summary's block
+                yield _block("paragraph", {"rich_text": [
+                    *_text_runs(f"{chapter.summary}\n"),
+                    *_text_runs("Key Points:", bold=True),
+                ]})
                 for point in chapter.key_points:
-                    blocks.append({
-                        "object": "block",
-                        "type": "bulleted_list_item",
-                        "bulleted_list_item": {
-                            "rich_text": [
-                                {
-                                    "type": "text",
-                                    "text": {
-                                        "content": point
-                                    }
-                                }
-                            ]
-                        }
-                    })
-        
-        return blocks
+                    yield _text_block("bulleted_list_item", point)
+            else:
+                yield _text_block("paragraph", chapter.summary)
     
-    def _create_questions_section(self, questions: List[str]) -> List[Dict[str, Any]]:
+    def _create_questions_section(self, questions: List[str]) -> Iterator[Dict[str, Any]]:
         """Create review questions section."""
-        blocks = []
-        
-        blocks.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [
-                    {
-                        "type": "text",
-                        "text": {
-                            "content": "❓ Review Questions"
-                        }
-                    }
-                ]
-            }
-        })
-        
-        for i, question in enumerate(questions, 1):
-            blocks.append({
-                "object": "block",
-                "type": "numbered_list_item",
-                "numbered_list_item": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": question
-                            }
-                        }
-                    ]
-                }
-            })
-        
-        return blocks
+        if not questions:
+            return
+        yield _text_block("heading_2", "❓ Review Questions")
+        for question in questions:
+            yield _text_block("numbered_list_item", question)
     
-    def _create_footer_section(self) -> List[Dict[str, Any]]:
+    def _create_footer_section(self) -> Iterator[Dict[str, Any]]:
         """Create footer section."""
-        blocks = []
-        
-        # Divider
-        blocks.append({
-            "object": "block",
-            "type": "divider",
-            "divider": {}
-        })
-        
-        # Footer text
         footer_text = (
             f"📝 *Notes generated automatically by Automated Lecture Notetaker*\n"
             f"⏰ Generated on {datetime.now().strftime('%Y-%m-%d at %H:%M')}"
         )
         
-        blocks.append({
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [
-                    {
-                        "type": "text",
-                        "text": {
-                            "content": footer_text
-                        },
-                        "annotations": {
-                            "italic": True
-                        }
-                    }
-                ]
-            }
-        })
-        
-        return blocks
+        yield _DIVIDER
+        yield _text_block("paragraph", footer_text, italic=True)
     
     def test_connection(self) -> bool:
         """Test the Notion API connection.
@@ -578,8 +745,10 @@ class NotionClient:
             True if connection is successful, False otherwise
         """
         try:
-            # Try to retrieve database info
-            self.client.databases.retrieve(database_id=self.database_id)
+            # Try to retrieve database info, keeping its schema for later pages
+            self._rate_limiter.wait()
+            database = self.client.databases.retrieve(database_id=self.database_id)
+            self._db_schema = database.get("properties", {})
             logger.info("Notion connection test successful")
             return True
         except Exception as e:
@@ -1,34 +1,119 @@
 """YouTube transcript extraction module."""
 
-import re
+import functools
+import os
+import sys
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, fields as dataclass_fields
 
 try:
     import googleapiclient.discovery
+    import googleapiclient.errors
+    import httplib2
 except ImportError:
     googleapiclient = None
 
 try:
-    from youtube_transcript_api import YouTubeTranscriptApi
+    from youtube_transcript_api import (
+        NoTranscriptFound,
+        TranscriptsDisabled,
+        VideoUnavailable,
+        YouTubeTranscriptApi,
+    )
+    # Failures that fetching again will not fix, unlike network errors,
+    # rate limiting or IP blocks
+    _PERMANENT_TRANSCRIPT_ERRORS: Tuple[type, ...] = (
+        NoTranscriptFound, TranscriptsDisabled, VideoUnavailable
+    )
 except ImportError:
     YouTubeTranscriptApi = None
+    _PERMANENT_TRANSCRIPT_ERRORS = ()
 
 try:
     from pytube import YouTube
 except ImportError:
     YouTube = None
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+from ..utils.compat import DATACLASS_SLOTS
+from ..utils.etag_cache import ETagCache
 from ..utils.exceptions import (
     TranscriptExtractionError,
     VideoNotFoundError,
     TranscriptNotAvailableError
 )
 from ..utils.logger import logger
+from ..utils.serialization import dumps, loads
+from ..utils.youtube_urls import PLAYLIST_ID_RE, VIDEO_ID_RE
+
+# Video metadata is reused from the disk cache for a day; view counts drift,
+# but titles and durations rarely change
+VIDEO_INFO_CACHE_TTL = 24 * 3600
+
+# Socket timeout for YouTube Data API requests, in seconds
+YOUTUBE_HTTP_TIMEOUT = 30
+
+# Most video IDs the videos.list endpoint accepts per request
+VIDEOS_PER_REQUEST = 50
+
+# Public video looked up by test_connection; the request costs one quota unit
+CONNECTION_TEST_VIDEO_ID = "dQw4w9WgXcQ"
+
+# Parsed transcripts are reused for a week; a missing transcript is only
+# remembered for an hour, since captions may still be added
+TRANSCRIPT_CACHE_TTL = 7 * 24 * 3600
+UNAVAILABLE_TRANSCRIPT_CACHE_TTL = 3600
 
+# Deleted or private videos rarely come back, so a lookup that found
+# nothing is remembered for a month
+VIDEO_NOT_FOUND_CACHE_TTL = 30 * 24 * 3600
+_VIDEO_NOT_FOUND = "not_found"
+
+
+if diskcache:
+    class _JSONDisk(diskcache.Disk):
+        """diskcache storage that keeps values as compact JSON, not pickles.
+        
+        Cached values are plain fields and (text, start, duration) rows,
+        which encode smaller and faster as JSON (with orjson if installed);
+        tuples come back as lists. Entries pickled by earlier versions are
+        still read as they are.
+        """
+        
+        def store(self, value, read, key=diskcache.UNKNOWN):
+            if not read:
+                value = dumps(value)
+            return super().store(value, read, key=key)
+        
+        def fetch(self, mode, filename, value, read):
+            data = super().fetch(mode, filename, value, read)
+            if not read and isinstance(data, bytes):
+                data = loads(data)
+            return data
+
+# Partial responses: only the properties we read are returned
+_VIDEO_FIELDS = (
+    "etag,items(id,snippet(title,description,channelTitle,publishedAt,"
+    "thumbnails/maxres/url),statistics(viewCount,likeCount),contentDetails/duration)"
+)
+_PLAYLIST_ITEM_FIELDS = "nextPageToken,items/contentDetails/videoId"
 
-@dataclass
+# Fields read from each youtube-transcript-api snippet
+_SNIPPET_FIELDS = attrgetter('text', 'start', 'duration')
+
+# Seconds per unit of the ISO 8601 durations returned by the API
+_DURATION_UNITS = {'D': 86400, 'H': 3600, 'M': 60, 'S': 1}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class VideoInfo:
     """Information about a YouTube video."""
     id: str
@@ -42,7 +127,13 @@ class VideoInfo:
     thumbnail_url: Optional[str] = None
 
 
-@dataclass
+# Cached video info is stored as plain fields, under keys that include the
+# VideoInfo field names; entries written for a different set of fields are
+# never read back, so changing the class needs no cache migration
+_VIDEO_INFO_SCHEMA = ",".join(field.name for field in dataclass_fields(VideoInfo))
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TranscriptSegment:
     """A segment of video transcript."""
     text: str
@@ -58,14 +149,28 @@ class TranscriptSegment:
 class TranscriptExtractor:
     """Extracts transcripts and metadata from YouTube videos."""
     
-    def __init__(self, youtube_api_key: str):
+    def __init__(self, youtube_api_key: str, cache_dir: Optional[str] = None):
         """Initialize the transcript extractor.
         
         Args:
             youtube_api_key: YouTube Data API v3 key
+            cache_dir: Directory for the on-disk caches of API responses
+                (None disables caching). Video info is revalidated with
+                ETags; parsed results are cached if ``diskcache`` is
+                installed.
         """
         self.youtube_api_key = youtube_api_key
-        self.youtube_service = None
+        # googleapiclient service objects are not thread-safe
+        self._service_lock = threading.Lock()
+        self._cache = None
+        self._etag_cache = None
+        if cache_dir:
+            cache_dir = os.path.expanduser(cache_dir)
+            self._etag_cache = ETagCache(os.path.join(cache_dir, "youtube_etags.db"))
+            if diskcache:
+                self._cache = diskcache.Cache(
+                    os.path.join(cache_dir, "youtube"), disk=_JSONDisk
+                )
         
         # Check for required dependencies
         if not googleapiclient:
@@ -77,22 +182,65 @@ class TranscriptExtractor:
             raise TranscriptExtractionError(
                 "YouTube Transcript API not installed. Please run: pip install youtube-transcript-api"
             )
+    
+    @functools.cached_property
+    def youtube_service(self) -> Any:
+        """YouTube Data API service, built on first use.
         
-        self._init_youtube_service()
+        Callers that only parse URLs never pay for building it.
+        """
+        return self._init_youtube_service()
     
-    def _init_youtube_service(self) -> None:
-        """Initialize YouTube API service."""
+    def _init_youtube_service(self) -> Any:
+        """Initialize YouTube API service.
+        
+        Uses the discovery document bundled with the client library instead
+        of downloading it. All requests go through one ``httplib2.Http``,
+        which keeps its connection to the API alive between calls. Its own
+        response cache stays off; conditional requests are handled by the
+        ETag store.
+        """
         try:
-            self.youtube_service = googleapiclient.discovery.build(
-                "youtube", "v3", developerKey=self.youtube_api_key
+            return googleapiclient.discovery.build(
+                "youtube", "v3",
+                developerKey=self.youtube_api_key,
+                http=httplib2.Http(timeout=YOUTUBE_HTTP_TIMEOUT),
+                static_discovery=True,
+                cache_discovery=False
             )
         except Exception as e:
             logger.error(f"Failed to initialize YouTube service: {e}")
             raise TranscriptExtractionError(f"YouTube API initialization failed: {e}")
     
-    def extract_video_id(self, url: str) -> str:
+    def test_connection(self) -> bool:
+        """Test the YouTube Data API connection and key.
+        
+        Building the service needs no network access, so a real (minimal)
+        request is made.
+        
+        Returns:
+            True if connection is successful, False otherwise
+        """
+        try:
+            request = self.youtube_service.videos().list(
+                part="id", id=CONNECTION_TEST_VIDEO_ID
+            )
+            with self._service_lock:
+                request.execute()
+            logger.info("YouTube connection test successful")
+            return True
+        except Exception as e:
+            logger.error(f"YouTube connection test failed: {e}")
+            return False
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def extract_video_id(url: str) -> str:
         """Extract video ID from YouTube URL.
         
+        Pure function of the URL, so results are memoized for URLs parsed
+        again later (retries, playlists).
+        
         Args:
             url: YouTube video URL
             
@@ -102,18 +250,74 @@ class TranscriptExtractor:
         Raises:
             TranscriptExtractionError: If video ID cannot be extracted
         """
-        patterns = [
-            r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([^&\n?#]+)',
-            r'youtube\.com\/watch\?.*v=([^&\n?#]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        match = VIDEO_ID_RE.search(url)
+        if match:
+            return match.group(1)
         
         raise TranscriptExtractionError(f"Could not extract video ID from URL: {url}")
     
+    def extract_playlist_id(self, url: str) -> str:
+        """Extract playlist ID from YouTube URL.
+        
+        Args:
+            url: YouTube playlist URL (or a video URL with a ``list`` parameter)
+            
+        Returns:
+            Playlist ID
+            
+        Raises:
+            TranscriptExtractionError: If playlist ID cannot be extracted
+        """
+        match = PLAYLIST_ID_RE.search(url)
+        if match:
+            return match.group(1)
+        
+        raise TranscriptExtractionError(f"Could not extract playlist ID from URL: {url}")
+    
+    def get_playlist_video_ids(
+        self, playlist_id: str, max_videos: Optional[int] = None
+    ) -> List[str]:
+        """Get the IDs of the videos in a playlist, in playlist order.
+        
+        Args:
+            playlist_id: YouTube playlist ID
+            max_videos: Maximum number of video IDs to return
+            
+        Returns:
+            List of video IDs
+            
+        Raises:
+            TranscriptExtractionError: If the API call fails
+        """
+        video_ids: List[str] = []
+        page_token = None
+        
+        try:
+            while max_videos is None or len(video_ids) < max_videos:
+                request = self.youtube_service.playlistItems().list(
+                    part="contentDetails",
+                    playlistId=playlist_id,
+                    maxResults=50,
+                    pageToken=page_token,
+                    fields=_PLAYLIST_ITEM_FIELDS
+                )
+                with self._service_lock:
+                    response = request.execute()
+                
+                video_ids.extend(
+                    item['contentDetails']['videoId'] for item in response.get('items', [])
+                )
+                
+                page_token = response.get('nextPageToken')
+                if not page_token:
+                    break
+                    
+        except Exception as e:
+            logger.error(f"Failed to list playlist {playlist_id}: {e}")
+            raise TranscriptExtractionError(f"Failed to list playlist: {e}")
+        
+        return video_ids[:max_videos] if max_videos is not None else video_ids
+    
     def get_video_info(self, video_id: str) -> VideoInfo:
         """Get video information from YouTube API.
         
@@ -127,77 +331,160 @@ class TranscriptExtractor:
             VideoNotFoundError: If video is not found
             TranscriptExtractionError: If API call fails
         """
-        try:
-            request = self.youtube_service.videos().list(
-                part="snippet,statistics,contentDetails",
-                id=video_id
-            )
-            response = request.execute()
+        video_info = self.get_video_info_batch([video_id]).get(video_id)
+        if video_info is None:
+            raise VideoNotFoundError(f"Video not found: {video_id}")
+        return video_info
+    
+    def get_video_info_batch(self, video_ids: List[str]) -> Dict[str, VideoInfo]:
+        """Get information for several videos, fetching up to 50 per API call.
+        
+        Args:
+            video_ids: YouTube video IDs
+            
+        Returns:
+            Dict mapping video IDs to VideoInfo objects, in input order;
+            videos that do not exist are left out
             
-            if not response['items']:
-                raise VideoNotFoundError(f"Video not found: {video_id}")
+        Raises:
+            TranscriptExtractionError: If an API call fails
+        """
+        unique_ids = list(dict.fromkeys(video_ids))
+        fields_by_id: Dict[str, Dict[str, Any]] = {}
+        not_found = set()
+        
+        if self._cache is not None:
+            for video_id in unique_ids:
+                fields = self._cache.get(("video_info", _VIDEO_INFO_SCHEMA, video_id))
+                if fields == _VIDEO_NOT_FOUND:
+                    logger.debug(f"Video known not to exist: {video_id}")
+                    not_found.add(video_id)
+                elif fields is not None:
+                    logger.debug(f"Video info cache hit: {video_id}")
+                    fields_by_id[video_id] = fields
+        
+        missing = [
+            video_id for video_id in unique_ids
+            if video_id not in fields_by_id and video_id not in not_found
+        ]
+        for i in range(0, len(missing), VIDEOS_PER_REQUEST):
+            chunk = missing[i:i + VIDEOS_PER_REQUEST]
+            try:
+                fetched = self._fetch_video_info_fields(chunk)
+            except Exception as e:
+                logger.error(f"Failed to get video info for {', '.join(chunk)}: {e}")
+                raise TranscriptExtractionError(f"Failed to get video info: {e}")
             
-            video_data = response['items'][0]
+            if self._cache is not None:
+                for video_id in chunk:
+                    if video_id in fetched:
+                        self._cache.set(
+                            ("video_info", _VIDEO_INFO_SCHEMA, video_id), fetched[video_id],
+                            expire=VIDEO_INFO_CACHE_TTL
+                        )
+                    else:
+                        self._cache.set(
+                            ("video_info", _VIDEO_INFO_SCHEMA, video_id), _VIDEO_NOT_FOUND,
+                            expire=VIDEO_NOT_FOUND_CACHE_TTL
+                        )
+            fields_by_id.update(fetched)
+        
+        return {
+            video_id: self._make_video_info(fields_by_id[video_id])
+            for video_id in unique_ids
+            if video_id in fields_by_id
+        }
+    
+    @staticmethod
+    def _make_video_info(fields: Dict[str, Any]) -> VideoInfo:
+        """Build a VideoInfo from its fields.
+        
+        Channel names repeat across the videos of a playlist, so they are
+        interned to share one string object. Titles and descriptions are
+        unique per video and left alone, since interned strings live on.
+        """
+        return VideoInfo(**{**fields, "channel_title": sys.intern(fields["channel_title"])})
+    
+    def _fetch_video_info_fields(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch the metadata of up to 50 videos in one API call.
+        
+        If the same videos were fetched before, the request is conditional
+        on the ETag of that response, and the stored result is reused when
+        the API answers 304 Not Modified.
+        
+        Returns:
+            Dict mapping the IDs of the videos found to their VideoInfo fields
+        """
+        ids = ",".join(video_ids)
+        request = self.youtube_service.videos().list(
+            part="snippet,statistics,contentDetails",
+            id=ids,
+            fields=_VIDEO_FIELDS
+        )
+        key = f"{_VIDEO_INFO_SCHEMA}:{ids}"
+        
+        stored = self._etag_cache.get(key) if self._etag_cache is not None else None
+        if stored is not None:
+            request.headers["If-None-Match"] = stored[0]
+        
+        try:
+            with self._service_lock:
+                response = request.execute()
+        except googleapiclient.errors.HttpError as e:
+            if stored is not None and e.resp.status == 304:
+                logger.debug(f"Video info not modified: {ids}")
+                return stored[1]
+            raise
+        
+        fields_by_id = {}
+        for video_data in response.get('items', []):
             snippet = video_data['snippet']
-            statistics = video_data['statistics']
+            # Empty parts are left out of partial responses
+            statistics = video_data.get('statistics', {})
             content_details = video_data['contentDetails']
             
             # Parse duration (ISO 8601 format)
             duration = self._parse_duration(content_details['duration'])
             
-            return VideoInfo(
-                id=video_id,
-                title=snippet['title'],
-                description=snippet['description'],
-                duration=duration,
-                channel_title=snippet['channelTitle'],
-                published_at=snippet['publishedAt'],
-                view_count=int(statistics.get('viewCount', 0)),
-                like_count=int(statistics.get('likeCount', 0)) if 'likeCount' in statistics else None,
-                thumbnail_url=snippet['thumbnails'].get('maxres', {}).get('url')
-            )
-            
-        except VideoNotFoundError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to get video info for {video_id}: {e}")
-            raise TranscriptExtractionError(f"Failed to get video info: {e}")
+            fields_by_id[video_data['id']] = {
+                "id": video_data['id'],
+                "title": snippet['title'],
+                "description": snippet.get('description', ''),
+                "duration": duration,
+                "channel_title": snippet['channelTitle'],
+                "published_at": snippet['publishedAt'],
+                "view_count": int(statistics.get('viewCount', 0)),
+                "like_count": int(statistics.get('likeCount', 0)) if 'likeCount' in statistics else None,
+                "thumbnail_url": snippet.get('thumbnails', {}).get('maxres', {}).get('url'),
+            }
+        
+        if self._etag_cache is not None and response.get('etag'):
+            self._etag_cache.set(key, response['etag'], fields_by_id)
+        return fields_by_id
     
     def _parse_duration(self, duration_str: str) -> int:
         """Parse ISO 8601 duration string to seconds.
         
+        Day components are included ('P1DT2H'); strings without any
+        components, such as 'P0D' or 'PT' for live streams, give 0.
+        
         Args:
             duration_str: ISO 8601 duration string (e.g., 'PT1H2M30S')
             
         Returns:
             Duration in seconds
         """
-        # Remove 'PT' prefix
-        duration_str = duration_str.replace('PT', '')
-        
-        hours = 0
-        minutes = 0
-        seconds = 0
-        
-        # Extract hours
-        if 'H' in duration_str:
-            hours_match = re.search(r'(\d+)H', duration_str)
-            if hours_match:
-                hours = int(hours_match.group(1))
-        
-        # Extract minutes
-        if 'M' in duration_str:
-            minutes_match = re.search(r'(\d+)M', duration_str)
-            if minutes_match:
-                minutes = int(minutes_match.group(1))
-        
-        # Extract seconds
-        if 'S' in duration_str:
-            seconds_match = re.search(r'(\d+)S', duration_str)
-            if seconds_match:
-                seconds = int(seconds_match.group(1))
-        
-        return hours * 3600 + minutes * 60 + seconds
+        # Single pass: accumulate digits, apply them at each unit letter.
+        # The 'P' and 'T' designators carry no number and are skipped.
+        total = 0
+        number = 0
+        for char in duration_str:
+            if '0' <= char <= '9':
+                number = number * 10 + ord(char) - 48
+            elif char in _DURATION_UNITS:
+                total += number * _DURATION_UNITS[char]
+                number = 0
+        return total
     
     def get_transcript(self, video_id: str, language: str = 'en') -> List[TranscriptSegment]:
         """Get transcript for a YouTube video.
@@ -213,6 +500,44 @@ class TranscriptExtractor:
             TranscriptNotAvailableError: If transcript is not available
             TranscriptExtractionError: If extraction fails
         """
+        return [
+            TranscriptSegment(text, start, duration)
+            for text, start, duration in self._get_transcript_rows(video_id, language)
+        ]
+    
+    def _get_transcript_rows(self, video_id: str, language: str) -> List[Tuple[str, float, float]]:
+        """Return a transcript as (text, start, duration) rows, cached on disk if possible."""
+        if self._cache is None:
+            return list(self._iter_transcript_rows(video_id, language))
+        
+        cache_key = ("transcript", video_id, language)
+        cached = self._cache.get(cache_key)
+        if isinstance(cached, str):
+            # Negative entry: the message of the earlier failure
+            raise TranscriptNotAvailableError(cached)
+        if cached is not None:
+            logger.debug(f"Transcript cache hit: {video_id}")
+            return cached
+        
+        try:
+            rows = list(self._iter_transcript_rows(video_id, language))
+        except TranscriptNotAvailableError as e:
+            # Only remember that there is no transcript, not transient failures
+            cause = e.__cause__
+            if cause is None or isinstance(cause, _PERMANENT_TRANSCRIPT_ERRORS):
+                self._cache.set(cache_key, str(e), expire=UNAVAILABLE_TRANSCRIPT_CACHE_TTL)
+            raise
+        
+        # Plain rows encode smaller and faster than the dataclasses
+        self._cache.set(cache_key, rows, expire=TRANSCRIPT_CACHE_TTL)
+        return rows
+    
+    def _iter_transcript_rows(self, video_id: str, language: str) -> Iterator[Tuple[str, float, float]]:
+        """Fetch a transcript from YouTube and yield its (text, start, duration) rows.
+        
+        Rows are produced while the fetched data is parsed, so callers that
+        only need the text never hold a TranscriptSegment per caption.
+        """
         try:
             # Based on the debug output, we need to instantiate YouTubeTranscriptApi
             api_instance = YouTubeTranscriptApi()
@@ -236,75 +561,19 @@ class TranscriptExtractor:
                 logger.error(f"Failed to fetch transcript: {e}")
                 raise TranscriptNotAvailableError(
                     f"No transcript available for video: {video_id}. Error: {e}"
-                )
+                ) from e
             
-            # The transcript_data might be a string or some other format
-            # Let's try to parse it into segments
-            segments = []
-            
-            # Check if it's a FetchedTranscript object with snippets
-            if hasattr(transcript_data, 'snippets'):
-                logger.info(f"Processing FetchedTranscript with {len(transcript_data.snippets)} snippets")
-                for snippet in transcript_data.snippets:
-                    if hasattr(snippet, 'text') and hasattr(snippet, 'start') and hasattr(snippet, 'duration'):
-                        segments.append(TranscriptSegment(
-                            text=snippet.text.strip(),
-                            start=float(snippet.start),
-                            duration=float(snippet.duration)
-                        ))
-                    else:
-                        # Fallback for dict-like snippet
-                        segments.append(TranscriptSegment(
-                            text=str(getattr(snippet, 'text', snippet)).strip(),
-                            start=float(getattr(snippet, 'start', 0)),
-                            duration=float(getattr(snippet, 'duration', 5.0))
-                        ))
-            elif isinstance(transcript_data, str):
-                # If it's a string, we need to split it into segments
-                # This is a simple approach - split by lines or sentences
-                lines = transcript_data.split('\n')
-                for i, line in enumerate(lines):
-                    line = line.strip()
-                    if line:
-                        segments.append(TranscriptSegment(
-                            text=line,
-                            start=float(i * 5),  # Estimate 5 seconds per line
-                            duration=5.0
-                        ))
-            elif isinstance(transcript_data, list):
-                # If it's already a list, try to parse each entry
-                for i, entry in enumerate(transcript_data):
-                    if isinstance(entry, dict):
-                        segments.append(TranscriptSegment(
-                            text=entry.get('text', '').strip(),
-                            start=float(entry.get('start', i * 5)),
-                            duration=float(entry.get('duration', 5.0))
-                        ))
-                    else:
-                        text = str(entry).strip()
-                        if text:
-                            segments.append(TranscriptSegment(
-                                text=text,
-                                start=float(i * 5),
-                                duration=5.0
-                            ))
-            else:
-                # Unknown format, convert to string
-                text = str(transcript_data).strip()
-                if text:
-                    segments.append(TranscriptSegment(
-                        text=text,
-                        start=0.0,
-                        duration=60.0  # Default duration
-                    ))
+            count = 0
+            for row in self._parse_transcript_data(transcript_data):
+                count += 1
+                yield row
             
-            if not segments:
+            if not count:
                 raise TranscriptNotAvailableError(
                     f"No usable transcript data found for video: {video_id}"
                 )
             
-            logger.info(f"Successfully extracted transcript with {len(segments)} segments")
-            return segments
+            logger.info(f"Successfully extracted transcript with {count} segments")
             
         except TranscriptNotAvailableError:
             raise
@@ -312,9 +581,66 @@ class TranscriptExtractor:
             logger.error(f"Failed to get transcript for {video_id}: {e}")
             raise TranscriptExtractionError(f"Transcript extraction failed: {e}")
     
+    def _parse_transcript_data(self, transcript_data: Any) -> Iterator[Tuple[str, float, float]]:
+        """Yield (text, start, duration) rows from fetched transcript data.
+        
+        The transcript_data might be a string or some other format.
+        """
+        # Check if it's a FetchedTranscript object with snippets
+        if hasattr(transcript_data, 'snippets'):
+            snippets = transcript_data.snippets
+            logger.info(f"Processing FetchedTranscript with {len(snippets)} snippets")
+            if not snippets:
+                return
+            
+            # All snippets of a transcript share one type, so check the
+            # schema on the first one instead of probing every snippet
+            first = snippets[0]
+            if hasattr(first, 'text') and hasattr(first, 'start') and hasattr(first, 'duration'):
+                for text, start, duration in map(_SNIPPET_FIELDS, snippets):
+                    yield text.strip(), float(start), float(duration)
+            else:
+                # Fallback for dict-like snippet
+                for snippet in snippets:
+                    yield (
+                        str(getattr(snippet, 'text', snippet)).strip(),
+                        float(getattr(snippet, 'start', 0)),
+                        float(getattr(snippet, 'duration', 5.0))
+                    )
+        elif isinstance(transcript_data, str):
+            # If it's a string, we need to split it into segments
+            # This is a simple approach - split by lines or sentences
+            lines = transcript_data.split('\n')
+            for i, line in enumerate(lines):
+                line = line.strip()
+                if line:
+                    # Estimate 5 seconds per line
+                    yield line, float(i * 5), 5.0
+        elif isinstance(transcript_data, list):
+            # If it's already a list, try to parse each entry
+            for i, entry in enumerate(transcript_data):
+                if isinstance(entry, dict):
+                    yield (
+                        entry.get('text', '').strip(),
+                        float(entry.get('start', i * 5)),
+                        float(entry.get('duration', 5.0))
+                    )
+                else:
+                    text = str(entry).strip()
+                    if text:
+                        yield text, float(i * 5), 5.0
+        else:
+            # Unknown format, convert to string
+            text = str(transcript_data).strip()
+            if text:
+                yield text, 0.0, 60.0  # Default duration
+    
     def get_transcript_text(self, video_id: str, language: str = 'en') -> str:
         """Get transcript as a single text string.
         
+        Without a disk cache the text is joined straight from the parsed
+        rows, without building transcript segments.
+        
         Args:
             video_id: YouTube video ID
             language: Preferred language code (default: 'en')
@@ -322,8 +648,11 @@ class TranscriptExtractor:
         Returns:
             Full transcript text
         """
-        segments = self.get_transcript(video_id, language)
-        return '\n'.join(segment.text for segment in segments)
+        if self._cache is not None:
+            rows: Iterable[Tuple[str, float, float]] = self._get_transcript_rows(video_id, language)
+        else:
+            rows = self._iter_transcript_rows(video_id, language)
+        return '\n'.join(text for text, _, _ in rows)
     
     def extract_from_url(self, url: str, language: str = 'en') -> Tuple[VideoInfo, List[TranscriptSegment]]:
         """Extract video info and transcript from YouTube URL.
@@ -336,7 +665,19 @@ class TranscriptExtractor:
             Tuple of (VideoInfo, List[TranscriptSegment])
         """
         video_id = self.extract_video_id(url)
-        video_info = self.get_video_info(video_id)
-        transcript = self.get_transcript(video_id, language)
+        
+        # The two calls go to different services, so fetch them concurrently
+        executor = ThreadPoolExecutor(max_workers=1)
+        transcript_future = executor.submit(self.get_transcript, video_id, language)
+        try:
+            video_info = self.get_video_info(video_id)
+            transcript = transcript_future.result()
+        except Exception:
+            # Don't wait for a transcript that is no longer needed
+            transcript_future.cancel()
+            raise
+        finally:
+            # A download that already started finishes in the background
+            executor.shutdown(wait=False)
         
         return video_info, transcript
@@ -1,6 +1,6 @@
 """Utilities package for the Lecture Notetaker."""
 
-from .config import Config
+from .compat import lazy_imports
 from .exceptions import (
     LectureNotetakerError,
     TranscriptExtractionError,
@@ -12,8 +12,16 @@ from .exceptions import (
 )
 from .logger import setup_logger, logger
 
+# Loaded on first attribute access (PEP 562); see the top-level package.
+# Exceptions and the logger are stdlib-only and stay eager.
+_LAZY_IMPORTS = {
+    "Config": ".config",
+    "get_config": ".config",
+}
+
 __all__ = [
     "Config",
+    "get_config",
     "LectureNotetakerError",
     "TranscriptExtractionError",
     "AIProcessingError", 
@@ -24,3 +32,5 @@ __all__ = [
     "setup_logger",
     "logger"
 ]
+
+__getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS, __all__)
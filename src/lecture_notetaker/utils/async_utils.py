@@ -0,0 +1,28 @@
+"""Helpers for driving the async implementations from synchronous code.
+
+Kept apart from utils.compat, which every package imports, so that
+importing the package does not load asyncio.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, TypeVar
+
+_T = TypeVar("_T")
+
+
+def run_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion from synchronous code.
+
+    ``asyncio.run`` refuses to start while the calling thread already runs
+    an event loop (e.g. in Jupyter or an async application); the coroutine
+    then runs on its own loop in a worker thread, and the caller blocks
+    until it finishes.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
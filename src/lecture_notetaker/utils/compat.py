@@ -0,0 +1,42 @@
+"""Compatibility and packaging helpers shared across the package."""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+# Keyword arguments enabling __slots__ on dataclasses, where supported
+# (``@dataclass(slots=True)`` was added in Python 3.10). Use as
+# ``@dataclass(**DATACLASS_SLOTS)``.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def lazy_imports(
+    module_name: str, imports: Dict[str, str], public: Sequence[str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the ``__getattr__`` and ``__dir__`` of a lazily importing package.
+
+    Names in ``imports`` are imported from their submodule on first
+    attribute access (PEP 562) and then stored on the package, so later
+    lookups are plain attribute reads. Use in a package's ``__init__``::
+
+        __getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS, __all__)
+
+    Args:
+        module_name: ``__name__`` of the package
+        imports: Maps each public name to the (relative) module defining it
+        public: The package's ``__all__``
+    """
+    namespace = vars(sys.modules[module_name])
+
+    def __getattr__(name: str) -> Any:
+        if name in imports:
+            module = importlib.import_module(imports[name], module_name)
+            value = getattr(module, name)
+            namespace[name] = value
+            return value
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(public))
+
+    return __getattr__, __dir__
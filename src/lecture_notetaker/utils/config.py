@@ -1,17 +1,31 @@
 """Configuration management for the Lecture Notetaker."""
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Optional
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from .compat import DATACLASS_SLOTS
 
+# Whether the default .env file has been loaded into os.environ yet
+_dotenv_loaded = False
 
-@dataclass
+# Required settings, as (field, environment variable) pairs
+_REQUIRED_SETTINGS = (
+    ("youtube_api_key", "YOUTUBE_API_KEY"),
+    ("google_ai_api_key", "GOOGLE_AI_API_KEY"),
+    ("notion_token", "NOTION_TOKEN"),
+    ("notion_database_id", "NOTION_DATABASE_ID"),
+)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Config:
-    """Configuration class for the Lecture Notetaker."""
+    """Configuration class for the Lecture Notetaker.
+    
+    Instances are immutable and hashable, so they can be used as cache keys.
+    """
     
     # API Keys
     youtube_api_key: str
@@ -24,6 +38,11 @@ class Config:
     chunk_size: int = 4000
     max_retries: int = 3
     
+    # Gemini quota, enforced client-side (gemini_rpm of 0 disables limiting).
+    # Defaults match a paid (Tier 1) key; free-tier keys need lower values.
+    gemini_rpm: int = 2000
+    gemini_tpm: int = 4_000_000
+    
     # Processing Settings
     summary_length: int = 300
     default_chapters: int = 5
@@ -32,9 +51,37 @@ class Config:
     # Notion Settings
     notion_page_title_template: str = "📚 {title} - Lecture Notes"
     
+    # Cache Settings (an empty cache_dir disables persistent caching)
+    cache_dir: str = "~/.cache/lecture_notetaker"
+    llm_cache_ttl: int = 7 * 24 * 3600
+    semantic_cache: bool = False
+    semantic_cache_threshold: float = 0.95
+    
     @classmethod
-    def from_env(cls) -> "Config":
-        """Create configuration from environment variables."""
+    @functools.lru_cache(maxsize=4)
+    def from_env(cls, env_file: Optional[str] = None) -> "Config":
+        """Create configuration from environment variables.
+        
+        The default .env file is loaded into ``os.environ`` once per process,
+        on first use; after that only ``os.environ`` is read. Results are also
+        memoized per ``env_file``, so repeated calls return the same instance.
+        
+        Args:
+            env_file: Optional path to a .env file loaded before reading
+                the environment (values already set take precedence)
+                
+        Returns:
+            Config instance
+        """
+        # An explicit file is loaded first so its values win over the default
+        if env_file:
+            load_dotenv(env_file)
+        
+        global _dotenv_loaded
+        if not _dotenv_loaded:
+            load_dotenv(override=False)
+            _dotenv_loaded = True
+        
         return cls(
             youtube_api_key=os.getenv("YOUTUBE_API_KEY", ""),
             google_ai_api_key=os.getenv("GOOGLE_AI_API_KEY", ""),
@@ -43,29 +90,40 @@ class Config:
             model_name=os.getenv("DEFAULT_MODEL", "gemini-pro"),
             chunk_size=int(os.getenv("CHUNK_SIZE", "4000")),
             max_retries=int(os.getenv("MAX_RETRIES", "3")),
+            gemini_rpm=int(os.getenv("GEMINI_RPM", "2000")),
+            gemini_tpm=int(os.getenv("GEMINI_TPM", "4000000")),
             summary_length=int(os.getenv("SUMMARY_LENGTH", "300")),
             default_chapters=int(os.getenv("DEFAULT_CHAPTERS", "5")),
             key_concepts_limit=int(os.getenv("KEY_CONCEPTS_LIMIT", "10")),
             notion_page_title_template=os.getenv(
                 "NOTION_PAGE_TITLE_TEMPLATE", 
                 "📚 {title} - Lecture Notes"
-            )
+            ),
+            cache_dir=os.getenv("CACHE_DIR", "~/.cache/lecture_notetaker"),
+            llm_cache_ttl=int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600))),
+            semantic_cache=os.getenv("SEMANTIC_CACHE", "").lower() in ("1", "true", "yes"),
+            semantic_cache_threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
         )
     
     def validate(self) -> None:
         """Validate that all required configuration is present."""
-        missing_keys = []
+        missing_keys = [
+            env_var for field, env_var in _REQUIRED_SETTINGS if not getattr(self, field)
+        ]
         
-        if not self.youtube_api_key:
-            missing_keys.append("YOUTUBE_API_KEY")
-        if not self.google_ai_api_key:
-            missing_keys.append("GOOGLE_AI_API_KEY")
-        if not self.notion_token:
-            missing_keys.append("NOTION_TOKEN")
-        if not self.notion_database_id:
-            missing_keys.append("NOTION_DATABASE_ID")
-            
         if missing_keys:
             raise ValueError(
                 f"Missing required environment variables: {', '.join(missing_keys)}"
             )
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the validated configuration from the environment, loaded once.
+    
+    Raises:
+        ValueError: If required settings are missing
+    """
+    config = Config.from_env()
+    config.validate()
+    return config
@@ -0,0 +1,64 @@
+"""Persistent store of API responses for conditional requests."""
+
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any, Optional, Tuple
+
+from .serialization import dumps, loads
+
+
+class ETagCache:
+    """SQLite-backed store of API payloads and the ETags they were served with.
+
+    The stored ETag is sent as ``If-None-Match`` on the next request for the
+    same resource; a ``304 Not Modified`` answer means the stored payload is
+    still current. Payloads are kept as JSON. A new connection is opened per
+    operation, so one instance can be shared by threads.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the cache.
+
+        Args:
+            path: Path of the SQLite database file (created if missing)
+        """
+        self.path = os.path.expanduser(path)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS resources ("
+                "key TEXT PRIMARY KEY, "
+                "etag TEXT, "
+                "payload BLOB, "
+                "fetched_at INTEGER)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key: str) -> Optional[Tuple[str, Any]]:
+        """Return the ``(etag, payload)`` stored for ``key``, or None."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT etag, payload FROM resources WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        etag, payload = row
+        return etag, loads(payload)
+
+    def set(self, key: str, etag: str, payload: Any) -> None:
+        """Store a payload (anything JSON-serializable) with its ETag."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO resources (key, etag, payload, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, etag, dumps(payload), int(time.time()))
+            )
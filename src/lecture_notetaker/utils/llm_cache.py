@@ -0,0 +1,289 @@
+"""Persistent cache for language model responses."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import faiss
+    import numpy as np
+
+from .exceptions import ConfigurationError
+from .logger import logger
+
+# Cached responses expire after a week by default
+DEFAULT_TTL = 7 * 24 * 3600
+
+# Least recently used entries beyond this count are evicted
+DEFAULT_MAX_ENTRIES = 10000
+
+# Local embedding model used by the semantic cache
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Minimum cosine similarity for a semantic cache hit
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+
+# Number of nearest cached prompts considered per semantic lookup
+SEMANTIC_TOP_K = 5
+
+
+class LLMCache:
+    """SQLite-backed response cache with TTL expiry and LRU eviction.
+
+    A new connection is opened per operation, so one instance can be shared
+    by the worker threads that issue model calls.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[int] = DEFAULT_TTL,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Path of the SQLite database file (created if missing)
+            ttl: Seconds after which an entry expires (None: never)
+            max_entries: Maximum number of entries kept (None: unbounded)
+        """
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "model TEXT, "
+                "response TEXT, "
+                "created_at INTEGER, "
+                "last_used INTEGER)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def make_scope(model: str, task: str, params: Dict[str, Any]) -> str:
+        """Build the scope of a model call: its model, task and parameters.
+
+        Only responses to calls in the same scope can stand in for each
+        other. The fields are serialized with sorted keys, so the order of
+        ``params`` does not matter.
+        """
+        data = {"model": model, "task": task, "params": params}
+        serialized = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def make_key(scope: str, content_hash: str, prompt: str) -> str:
+        """Build the cache key for a model call.
+
+        The key covers the call's scope (see make_scope), the hash of the
+        full source content and the hash of the rendered prompt. Prompts only
+        hold a truncated transcript, so the content hash is what keeps two
+        lectures that start the same way apart.
+        """
+        data = {
+            "scope": scope,
+            "content": content_hash,
+            "prompt": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+        }
+        serialized = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def lookup(self, model: str, key: str, scope: str, source: str) -> Optional[str]:
+        """Return the cached response for a call, or None on a miss."""
+        return self.get(key)
+
+    def store(
+        self, model: str, key: str, scope: str, source: str, response: str
+    ) -> None:
+        """Cache the response to a call."""
+        self.set(key, response, model)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key``, or None on a miss."""
+        now = int(time.time())
+
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            response, created_at = row
+            if self.ttl is not None and now - created_at > self.ttl:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+
+        logger.debug(f"LLM cache hit: {key[:12]}")
+        return response
+
+    def set(self, key: str, value: str, model: str) -> None:
+        """Store a response, evicting least recently used entries if needed."""
+        now = int(time.time())
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, model, response, created_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, model, value, now, now)
+            )
+
+            if self.max_entries is not None:
+                conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+
+
+class SemanticLLMCache:
+    """Semantic layer on top of LLMCache.
+
+    Exact hits are served by the wrapped cache. On a miss, the source text of
+    the call (the transcript excerpt, not the instructions around it) is
+    embedded and compared against the sources of earlier calls in the same
+    scope, i.e. with the same model, task and parameters; if the most
+    similar one clears ``threshold`` (cosine similarity), its response is
+    returned. Scopes leave out the video ID, so this catches a lecture that
+    was re-uploaded, or whose captions were re-published with only minor
+    edits, without ever answering one task or chapter with the response to
+    another.
+
+    Embeddings are stored next to the responses and loaded into per-scope
+    in-memory FAISS indexes on startup. numpy, faiss and
+    sentence-transformers (which loads torch) are only imported here, so
+    the exact-match cache never pays for them.
+    """
+
+    def __init__(
+        self,
+        cache: LLMCache,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL
+    ):
+        """Initialize the semantic cache.
+
+        Args:
+            cache: Exact-match cache holding the responses
+            threshold: Minimum cosine similarity for a semantic hit
+            embedding_model: Name of the sentence-transformers model
+        """
+        try:
+            import faiss
+            import numpy as np
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ConfigurationError(
+                "Semantic caching requires extra packages. "
+                "Please run: pip install sentence-transformers faiss-cpu"
+            )
+
+        self._np = np
+        self._faiss = faiss
+        self.cache = cache
+        self.threshold = threshold
+        self._embedder = SentenceTransformer(embedding_model)
+        self._dimension = self._embedder.get_sentence_embedding_dimension()
+        self._indexes: Dict[str, "faiss.Index"] = {}
+        self._keys: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+        with closing(self.cache._connect()) as conn, conn:
+            # Earlier versions embedded whole prompts, indexed by model only
+            conn.execute("DROP TABLE IF EXISTS embeddings")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS source_embeddings ("
+                "key TEXT PRIMARY KEY, "
+                "scope TEXT, "
+                "vector BLOB)"
+            )
+            rows = conn.execute(
+                "SELECT key, scope, vector FROM source_embeddings"
+            ).fetchall()
+
+        for key, scope, vector in rows:
+            self._add(scope, key, np.frombuffer(vector, dtype=np.float32))
+
+        logger.info(f"Loaded {len(rows)} source embeddings for semantic caching")
+
+    def _embed(self, source: str) -> "np.ndarray":
+        """Return the normalized embedding of a call's source text."""
+        text = " ".join(source.split())
+        vector = self._embedder.encode(text, normalize_embeddings=True)
+        return self._np.asarray(vector, dtype=self._np.float32)
+
+    def _add(self, scope: str, key: str, vector: "np.ndarray") -> None:
+        """Add an embedding to the in-memory index for a scope."""
+        with self._lock:
+            index = self._indexes.get(scope)
+            if index is None:
+                # Inner product of normalized vectors is cosine similarity
+                index = self._indexes[scope] = self._faiss.IndexFlatIP(self._dimension)
+                self._keys[scope] = []
+            index.add(vector.reshape(1, -1))
+            self._keys[scope].append(key)
+
+    def lookup(self, model: str, key: str, scope: str, source: str) -> Optional[str]:
+        """Return the cached response for a call, or for one with a similar source."""
+        response = self.cache.get(key)
+        if response is not None:
+            return response
+
+        with self._lock:
+            index = self._indexes.get(scope)
+            if index is None or index.ntotal == 0:
+                return None
+
+        query = self._embed(source).reshape(1, -1)
+        with self._lock:
+            scores, ids = index.search(query, min(SEMANTIC_TOP_K, index.ntotal))
+            candidates = [
+                (float(score), self._keys[scope][i])
+                for score, i in zip(scores[0], ids[0])
+                if i >= 0 and score >= self.threshold
+            ]
+
+        # Candidates are sorted by similarity; entries may have expired
+        for score, key in candidates:
+            response = self.cache.get(key)
+            if response is not None:
+                logger.debug(f"Semantic cache hit (similarity {score:.3f})")
+                return response
+
+        return None
+
+    def store(
+        self, model: str, key: str, scope: str, source: str, response: str
+    ) -> None:
+        """Cache the response to a call and index the embedding of its source."""
+        self.cache.set(key, response, model)
+
+        vector = self._embed(source)
+        with closing(self.cache._connect()) as conn, conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO source_embeddings (key, scope, vector) "
+                "VALUES (?, ?, ?)",
+                (key, scope, vector.tobytes())
+            )
+        if cursor.rowcount:
+            self._add(scope, key, vector)
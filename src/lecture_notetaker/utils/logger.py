@@ -2,13 +2,14 @@
 
 import logging
 import sys
-from typing import Optional
+from typing import Optional, TextIO
 
 
 def setup_logger(
     name: str = "lecture_notetaker",
     level: str = "INFO",
-    log_file: Optional[str] = None
+    log_file: Optional[str] = None,
+    stream: Optional[TextIO] = None
 ) -> logging.Logger:
     """Set up and configure logger.
     
@@ -16,6 +17,7 @@ def setup_logger(
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional file path to write logs to
+        stream: Console stream to log to (default: stdout)
         
     Returns:
         Configured logger instance
@@ -32,7 +34,7 @@ def setup_logger(
     )
     
     # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = logging.StreamHandler(stream or sys.stdout)
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
@@ -0,0 +1,90 @@
+"""Persistent record of published Notion pages."""
+
+import dataclasses
+import hashlib
+import json
+import os
+import shelve
+import threading
+from typing import Any, Optional, Tuple
+
+from .logger import logger
+
+
+class PageCache:
+    """Maps the content of a notes page to the page it was published as.
+
+    Lets retries and re-runs return the existing page instead of creating a
+    duplicate. It also records which videos have a published page, so a
+    re-run can tell up front that it will probably not need a new one. The
+    shelf is opened per operation and guarded by a lock, so one instance
+    can be shared by threads.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the cache.
+
+        Args:
+            path: Path of the shelve database (created if missing)
+        """
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(database_id: str, video_id: str, title: str, content: Any) -> str:
+        """Build the cache key for a page.
+
+        Args:
+            database_id: ID of the database the page is created in
+            video_id: YouTube video ID
+            title: Page title
+            content: Processed content (a dataclass instance)
+        """
+        data = {
+            "database": database_id,
+            "video": video_id,
+            "title": title,
+            "content": dataclasses.asdict(content),
+        }
+        serialized = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def make_video_key(database_id: str, video_id: str) -> str:
+        """Build the key recording that a video has a page in a database."""
+        return f"video:{database_id}:{video_id}"
+
+    def get(self, key: str) -> Optional[Tuple[Optional[str], str]]:
+        """Return the ``(page_id, url)`` of the page published for ``key``, or None.
+
+        The page ID is None for entries recorded before IDs were stored.
+        """
+        with self._lock, shelve.open(self.path) as shelf:
+            entry = shelf.get(key)
+
+        if entry is None:
+            return None
+        logger.debug(f"Notion page cache hit: {key[:12]}")
+        if isinstance(entry, str):
+            return None, entry
+        return entry["id"], entry["url"]
+
+    def set(self, key: str, page_id: str, url: str, video_key: str) -> None:
+        """Record a published page, and that its video has a page."""
+        with self._lock, shelve.open(self.path) as shelf:
+            shelf[key] = {"id": page_id, "url": url}
+            shelf[video_key] = True
+
+    def delete(self, key: str) -> None:
+        """Forget a published page, e.g. one that was deleted in Notion."""
+        with self._lock, shelve.open(self.path) as shelf:
+            shelf.pop(key, None)
+
+    def has_video(self, video_key: str) -> bool:
+        """Return whether a page was recorded for the video (see make_video_key)."""
+        with self._lock, shelve.open(self.path) as shelf:
+            return video_key in shelf
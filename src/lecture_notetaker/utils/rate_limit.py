@@ -0,0 +1,70 @@
+"""Client-side rate limiting for API calls."""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Request and token rate limiter modelled on per-minute API quotas.
+
+    Two buckets refill continuously: one holding up to ``rpm`` requests and
+    one holding up to ``tpm`` tokens. A call that overdraws either bucket is
+    delayed until the deficit has refilled. Capacity is reserved immediately,
+    so concurrent callers queue up behind each other instead of all waking
+    at once.
+
+    The state is guarded by a thread lock rather than an asyncio lock, so a
+    single limiter can be shared by worker threads and by several event
+    loops.
+    """
+
+    def __init__(self, rpm: int, tpm: Optional[int] = None, burst: Optional[int] = None):
+        """Initialize the limiter.
+
+        Args:
+            rpm: Requests allowed per minute
+            tpm: Tokens allowed per minute (None: not limited)
+            burst: Requests that may be sent back to back (None: rpm)
+        """
+        if rpm <= 0:
+            raise ValueError("rpm must be positive")
+
+        self.rpm = rpm
+        self.tpm = tpm
+        self.burst = burst or rpm
+        self._requests = float(self.burst)
+        self._tokens = float(tpm or 0)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        """Take one request and ``tokens`` tokens; return the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+
+            self._requests = min(self.burst, self._requests + elapsed * self.rpm / 60) - 1
+            delay = max(0.0, -self._requests * 60 / self.rpm)
+
+            if self.tpm:
+                # A single oversized call must not wait forever
+                tokens = min(tokens, self.tpm)
+                self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60) - tokens
+                delay = max(delay, -self._tokens * 60 / self.tpm)
+
+            return delay
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until a request using ``tokens`` tokens may be sent."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def wait(self, tokens: int = 0) -> None:
+        """Blocking variant of acquire, for code running in worker threads."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
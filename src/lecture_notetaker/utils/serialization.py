@@ -0,0 +1,23 @@
+"""Compact JSON encoding for the persistent caches."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(value: Any) -> bytes:
+    """Encode a value as compact JSON, with orjson if it is installed."""
+    if orjson:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON produced by dumps."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
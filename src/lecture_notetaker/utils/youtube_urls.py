@@ -0,0 +1,19 @@
+"""Patterns for YouTube video and playlist URLs.
+
+Kept free of heavy imports, so the CLI can check URLs with the exact rules
+used for extraction before any service code is loaded.
+"""
+
+import re
+
+# Video IDs are 11 characters; covers watch (with v= anywhere in the query),
+# embed, v/, shorts, live, youtu.be and youtube-nocookie URLs, on any
+# youtube.com subdomain (www, m, music)
+VIDEO_ID_RE = re.compile(
+    r'(?:youtube\.com/(?:watch\?(?:[^&]*&)*v=|embed/|v/|shorts/|live/)'
+    r'|youtu\.be/'
+    r'|youtube-nocookie\.com/(?:watch\?(?:[^&]*&)*v=|embed/))'
+    r'([A-Za-z0-9_-]{11})'
+)
+
+PLAYLIST_ID_RE = re.compile(r'[?&]list=([A-Za-z0-9_-]+)')
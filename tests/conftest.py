@@ -0,0 +1,6 @@
+"""Pytest configuration: make the package importable from a source checkout."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
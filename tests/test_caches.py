@@ -0,0 +1,64 @@
+"""Tests for the cache keys of the response and page caches."""
+
+from lecture_notetaker.core.ai_processor import Chapter, ProcessedContent
+from lecture_notetaker.utils.llm_cache import LLMCache
+from lecture_notetaker.utils.page_cache import PageCache
+
+
+def _content(summary="Summary"):
+    return ProcessedContent(
+        summary=summary,
+        key_concepts=[],
+        chapters=[Chapter("Intro", 0.0, 60.0, "Opening", ["Point"])],
+        main_topics=["Topic"],
+        learning_objectives=[],
+        questions=[],
+    )
+
+
+def test_scope_ignores_parameter_order():
+    first = LLMCache.make_scope("m", "summary", {"length": 300, "language": "en"})
+    second = LLMCache.make_scope("m", "summary", {"language": "en", "length": 300})
+    assert first == second
+
+
+def test_scope_depends_on_model_task_and_params():
+    scope = LLMCache.make_scope("m", "summary", {"length": 300})
+    assert LLMCache.make_scope("other", "summary", {"length": 300}) != scope
+    assert LLMCache.make_scope("m", "chapters", {"length": 300}) != scope
+    assert LLMCache.make_scope("m", "summary", {"length": 200}) != scope
+
+
+def test_key_is_stable():
+    scope = LLMCache.make_scope("m", "summary", {})
+    assert LLMCache.make_key(scope, "hash", "prompt") == LLMCache.make_key(scope, "hash", "prompt")
+    # Pinned, so an accidental change to the key layout invalidating every
+    # cached response does not go unnoticed
+    assert LLMCache.make_key("scope", "hash", "prompt") == (
+        "b751a8929ded7bd2da5825689eddc24ee45231f5b6701827dbb5e337f1cd8897"
+    )
+
+
+def test_key_depends_on_every_part():
+    scope = LLMCache.make_scope("m", "summary", {})
+    key = LLMCache.make_key(scope, "hash", "prompt")
+    assert LLMCache.make_key(LLMCache.make_scope("m", "overview", {}), "hash", "prompt") != key
+    assert LLMCache.make_key(scope, "other", "prompt") != key
+    assert LLMCache.make_key(scope, "hash", "other") != key
+
+
+def test_cache_round_trip(tmp_path):
+    cache = LLMCache(str(tmp_path / "llm.sqlite"))
+    scope = LLMCache.make_scope("m", "summary", {})
+    key = LLMCache.make_key(scope, "hash", "prompt")
+    
+    assert cache.lookup("m", key, scope, "source") is None
+    cache.store("m", key, scope, "source", "response")
+    assert cache.lookup("m", key, scope, "source") == "response"
+
+
+def test_page_key_is_stable_and_content_sensitive():
+    key = PageCache.make_key("db", "vid", "Title", _content())
+    assert PageCache.make_key("db", "vid", "Title", _content()) == key
+    assert PageCache.make_key("db", "vid", "Title", _content("Other")) != key
+    assert PageCache.make_key("db", "other", "Title", _content()) != key
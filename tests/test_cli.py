@@ -0,0 +1,46 @@
+"""Tests for command-line argument handling."""
+
+import pytest
+
+from lecture_notetaker.cli.main import create_parser, fast_parse, translate_legacy_args
+
+
+@pytest.mark.parametrize("argv, expected", [
+    (["--url", "U"], ["process", "--url", "U"]),
+    (["--url=U", "--no-notion"], ["process", "--url=U", "--no-notion"]),
+    (["--playlist", "P"], ["playlist", "--url", "P"]),
+    (["--playlist", "P", "--chapters", "3"], ["playlist", "--url", "P", "--chapters", "3"]),
+    (["--info", "A"], ["info", "--url", "A"]),
+    (["--test-connections"], ["test-connections"]),
+])
+def test_legacy_flag_selects_subcommand(argv, expected):
+    assert translate_legacy_args(argv) == expected
+
+
+def test_legacy_flags_follow_flat_layout_precedence():
+    assert translate_legacy_args(["--info", "A", "--url", "B"]) == ["info", "--url", "A"]
+    assert translate_legacy_args(["--url", "A", "--playlist", "B"]) == ["process", "--url", "A"]
+
+
+def test_legacy_test_connections_ignores_stray_arguments():
+    argv = ["--log-level", "DEBUG", "--test-connections", "--url", "X", "--chapters", "2"]
+    assert translate_legacy_args(argv) == ["test-connections", "--log-level", "DEBUG"]
+
+
+def test_subcommand_layout_is_left_alone():
+    argv = ["process", "--url", "U", "--info", "A"]
+    assert translate_legacy_args(argv) == argv
+
+
+def test_playlist_accepts_processing_options():
+    argv = translate_legacy_args(["--playlist", "P", "--chapters", "3", "--no-notion"])
+    
+    fast = fast_parse(argv)
+    full = create_parser(argv[0]).parse_args(argv)
+    
+    for args in (fast, full):
+        assert args.url == "P"
+        assert args.chapters == 3
+        assert args.no_notion is True
+        assert args.max_concurrency == 5
+    assert vars(fast) == vars(full)
@@ -0,0 +1,68 @@
+"""Tests for the client-side rate limiter."""
+
+import pytest
+
+from lecture_notetaker.utils import rate_limit
+from lecture_notetaker.utils.rate_limit import TokenBucket
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only advances when told to."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock)
+    return clock
+
+
+def test_burst_is_free_then_requests_wait(clock):
+    bucket = TokenBucket(rpm=60, burst=2)
+    
+    assert bucket._reserve(0) == 0
+    assert bucket._reserve(0) == 0
+    assert bucket._reserve(0) == pytest.approx(1.0)
+    # Reservations queue up behind each other
+    assert bucket._reserve(0) == pytest.approx(2.0)
+
+
+def test_requests_refill_over_time(clock):
+    bucket = TokenBucket(rpm=60, burst=1)
+    
+    assert bucket._reserve(0) == 0
+    clock.now += 0.5
+    assert bucket._reserve(0) == pytest.approx(0.5)
+    clock.now += 10
+    # Refill is capped at the burst size
+    assert bucket._reserve(0) == 0
+    assert bucket._reserve(0) == pytest.approx(1.0)
+
+
+def test_tokens_refill_over_time(clock):
+    bucket = TokenBucket(rpm=6000, tpm=600)
+    
+    assert bucket._reserve(600) == 0
+    assert bucket._reserve(300) == pytest.approx(30.0)
+    clock.now += 30
+    assert bucket._reserve(0) == 0
+    clock.now += 60
+    assert bucket._reserve(600) == 0
+
+
+def test_oversized_call_is_capped_at_one_minute_of_tokens(clock):
+    bucket = TokenBucket(rpm=60, tpm=100)
+    
+    assert bucket._reserve(100) == 0
+    assert bucket._reserve(10 ** 6) == pytest.approx(60.0)
+
+
+def test_rpm_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucket(rpm=0)